@@ -3,7 +3,6 @@ Plain Press Finder Flask Application Factory
 """
 import logging
 import os
-from flask import Flask
 from dotenv import load_dotenv
 
 # Silence verbose SQLAlchemy logging (prevents Railway rate limit issues)
@@ -20,6 +19,8 @@ def create_app(config=None):
     Returns:
         Flask application instance
     """
+    from flask import Flask
+
     # Load environment variables
     load_dotenv()
     
@@ -39,9 +40,20 @@ def create_app(config=None):
     return app
 
 
-# Create app instance for direct running
-app = create_app()
+def __getattr__(name):
+    """
+    Create the app instance on first access (gunicorn app:app)
+
+    Scripts import app.models and app.services through this package, so
+    building the app eagerly would pull Flask and every route dependency
+    into each cron job and worker.
+    """
+    if name == 'app':
+        instance = create_app()
+        globals()['app'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    create_app().run(debug=True, port=5000)
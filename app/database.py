@@ -2,9 +2,11 @@
 Database configuration and session management for Amish News Finder
 """
 import os
+import re
 import sys
 import time
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from dotenv import load_dotenv
 
@@ -14,6 +16,9 @@ load_dotenv()
 # Create declarative base for all models
 Base = declarative_base()
 
+# LISTEN/NOTIFY channel signalled when discovery queues new unfiltered articles
+ARTICLES_INSERTED_CHANNEL = "articles_inserted"
+
 
 def _log_db(msg: str):
     """Log database progress with immediate flush."""
@@ -54,7 +59,7 @@ def create_db_engine(database_url=None):
         database_url,
         pool_size=5,               # Base connection pool size
         max_overflow=10,           # Max additional connections
-        pool_pre_ping=True,        # Verify connections before use
+        pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "True").lower() in ("1", "true", "yes"),  # Verify connections before use
         pool_recycle=3600,         # Recycle connections after 1 hour
         connect_args={"connect_timeout": 30},  # 30 second connection timeout
         echo=os.getenv("FLASK_DEBUG", "False") == "True"  # SQL logging in debug mode
@@ -65,6 +70,39 @@ def create_db_engine(database_url=None):
     return engine
 
 
+def create_async_db_engine(database_url=None):
+    """
+    Create an async SQLAlchemy engine (asyncpg driver) with connection pooling
+
+    Used by the background filter worker so database I/O can overlap with
+    Claude API calls on one event loop.
+
+    Args:
+        database_url: Optional database URL override
+
+    Returns:
+        SQLAlchemy AsyncEngine instance
+    """
+    if database_url is None:
+        database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    # postgres:// and postgresql+psycopg2:// URLs both map to the asyncpg driver
+    async_url = re.sub(r"^postgres(ql)?(\+\w+)?://", "postgresql+asyncpg://", database_url)
+
+    return create_async_engine(
+        async_url,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        connect_args={"timeout": 30},  # asyncpg's connection timeout
+        echo=os.getenv("FLASK_DEBUG", "False") == "True"
+    )
+
+
 # Create default engine and session factory
 _log_db("Module loading - creating default engine...")
 _module_start = time.time()
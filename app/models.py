@@ -10,8 +10,8 @@ from uuid import UUID
 from typing import Optional
 
 from sqlalchemy import (
-    Column, String, Text, Float, DateTime, Date, Integer, Boolean,
-    Enum as SAEnum, ForeignKey, Index
+    Column, String, Text, Float, DateTime, Date, Integer, Boolean, LargeBinary,
+    Enum as SAEnum, ForeignKey, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship, Mapped
@@ -198,6 +198,10 @@ class Article(Base):
         Index("ix_articles_is_published", "is_published"),
         Index("ix_articles_is_rejected", "is_rejected"),
         Index("ix_articles_filter_status", "filter_status"),
+        # Partial index for the filter worker's claims: walked in created_at
+        # order, so ORDER BY created_at LIMIT n stops after n entries
+        Index("ix_articles_filter_queue", "created_at",
+              postgresql_where=text("filter_status = 'unfiltered'")),
     )
 
 
@@ -360,6 +364,7 @@ class FilterRule(Base):
     __table_args__ = (
         Index("ix_filter_rules_is_active", "is_active"),
         Index("ix_filter_rules_priority", "priority"),
+        Index("ix_filter_rules_rule_text", "rule_text", unique=True),
     )
 
 
@@ -670,6 +675,30 @@ class FilterTrace(Base):
     )
 
 
+class FilterCache(Base):
+    """
+    Cached result of one filter evaluating one piece of content.
+    
+    Keyed by a SHA-256 of the filter input so articles that resurface in
+    RSS/Exa feeds are not sent to Claude a second time.
+    """
+    __tablename__ = "filter_cache"
+    
+    # Composite Primary Key
+    content_hash: Mapped[bytes] = Column(LargeBinary, primary_key=True)
+    filter_name: Mapped[str] = Column(String(50), primary_key=True)  # news_check, wow_factor, values_fit
+    
+    # Filter result fields (passed, reasoning, category/score)
+    result: Mapped[dict] = Column(JSONB, nullable=False)
+    
+    # Timestamps
+    created_at: Mapped[datetime] = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now()
+    )
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
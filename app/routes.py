@@ -16,7 +16,7 @@ from uuid import UUID
 import feedparser
 import httpx
 from flask import Blueprint, render_template, request, abort, jsonify, flash, redirect, url_for
-from sqlalchemy import func
+from sqlalchemy import func, select
 from werkzeug.exceptions import HTTPException
 
 from app.database import SessionLocal
@@ -376,15 +376,17 @@ def admin_articles():
         ).limit(ARTICLES_PER_PAGE).all()
 
         # Get stats
-        stats = {
-            'total': session.query(Article).count(),
-            'pending': session.query(Article).filter(Article.status == ArticleStatus.PENDING).count(),
-            'emailed': session.query(Article).filter(Article.status == ArticleStatus.EMAILED).count(),
-            'good': session.query(Article).filter(Article.status == ArticleStatus.GOOD).count(),
-            'rejected': session.query(Article).filter(Article.status == ArticleStatus.REJECTED).count(),
-            'published': session.query(Article).filter(Article.status == ArticleStatus.PUBLISHED).count(),
-            'high_score': session.query(Article).filter(Article.filter_score >= 0.5).count(),
-        }
+        stats = session.execute(
+            select(
+                func.count().label('total'),
+                func.count().filter(Article.status == ArticleStatus.PENDING).label('pending'),
+                func.count().filter(Article.status == ArticleStatus.EMAILED).label('emailed'),
+                func.count().filter(Article.status == ArticleStatus.GOOD).label('good'),
+                func.count().filter(Article.status == ArticleStatus.REJECTED).label('rejected'),
+                func.count().filter(Article.status == ArticleStatus.PUBLISHED).label('published'),
+                func.count().filter(Article.filter_score >= 0.5).label('high_score'),
+            ).select_from(Article)
+        ).one()._asdict()
 
         # Get unique sources for dropdown
         sources = [r[0] for r in session.query(Article.source_name).distinct().order_by(Article.source_name).all()]
@@ -702,11 +704,12 @@ def admin_sources():
         sources = query.all()
         
         # Calculate stats
-        total_rss = session.query(Source).filter(Source.type == SourceType.RSS).count()
-        active_count = session.query(Source).filter(
-            Source.type == SourceType.RSS,
-            Source.is_active == True
-        ).count()
+        total_rss, active_count = session.execute(
+            select(
+                func.count(),
+                func.count().filter(Source.is_active == True)
+            ).where(Source.type == SourceType.RSS)
+        ).one()
         paused_count = total_rss - active_count
         
         stats = {
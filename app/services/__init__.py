@@ -7,23 +7,33 @@ This package contains services for the daily article discovery pipeline:
 - url_normalizer: Normalize URLs for deduplication
 - claude_filter: Filter articles via Claude Haiku
 - discovery: Orchestrate the complete discovery workflow
+
+The re-exports below are resolved on first access, so importing a single
+service module (e.g. from the filter worker) does not load the Exa,
+Anthropic and feed-parsing clients for every other service.
 """
 
-from app.services.rss_fetcher import fetch_rss_feed, fetch_all_rss_sources
-from app.services.exa_searcher import search_articles, search_all_queries
-from app.services.url_normalizer import normalize_url, deduplicate_articles
-from app.services.claude_filter import filter_articles, filter_all_articles
-from app.services.discovery import run_discovery_job
+import importlib
+
+_EXPORTS = {
+    'fetch_rss_feed': 'app.services.rss_fetcher',
+    'fetch_all_rss_sources': 'app.services.rss_fetcher',
+    'search_articles': 'app.services.exa_searcher',
+    'search_all_queries': 'app.services.exa_searcher',
+    'normalize_url': 'app.services.url_normalizer',
+    'deduplicate_articles': 'app.services.url_normalizer',
+    'filter_articles': 'app.services.claude_filter',
+    'filter_all_articles': 'app.services.claude_filter',
+    'run_discovery_job': 'app.services.discovery',
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'fetch_rss_feed',
-    'fetch_all_rss_sources',
-    'search_articles',
-    'search_all_queries',
-    'normalize_url',
-    'deduplicate_articles',
-    'filter_articles',
-    'filter_all_articles',
-    'run_discovery_job',
-]
 
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
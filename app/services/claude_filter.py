@@ -10,6 +10,8 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import Optional
 
 from anthropic import Anthropic
@@ -39,6 +41,7 @@ MAX_TOKENS = 4096
 STRUCTURED_OUTPUTS_BETA = os.environ.get("ANTHROPIC_STRUCTURED_OUTPUTS_BETA", "structured-outputs-2025-11-13")
 TEMPERATURE = 0  # Deterministic for consistency
 BATCH_SIZE = int(os.environ.get('BATCH_SIZE', '10'))
+MAX_CONCURRENT_BATCHES = int(os.environ.get('MAX_CONCURRENT_BATCHES', '4'))
 FILTER_THRESHOLD = float(os.environ.get('FILTER_SCORE_THRESHOLD', '0.5'))
 WOW_SCORE_THRESHOLD = float(os.environ.get('WOW_SCORE_THRESHOLD', '0.4'))
 MAX_RETRIES = 2
@@ -188,34 +191,46 @@ def build_system_prompt() -> str:
     try:
         rules = session.query(FilterRule).filter(FilterRule.is_active == True).all()
         _log_claude(f"Found {len(rules)} active FilterRules")
-
-        # Group rules by type
-        must_have = []
-        must_avoid = []
-        good_topics = []
-        borderline = []
-
-        for rule in rules:
-            if rule.rule_type == RuleType.MUST_HAVE:
-                must_have.append(f"- {rule.rule_text}")
-            elif rule.rule_type == RuleType.MUST_AVOID:
-                must_avoid.append(f"- {rule.rule_text}")
-            elif rule.rule_type == RuleType.GOOD_TOPIC:
-                good_topics.append(f"- {rule.rule_text}")
-            elif rule.rule_type == RuleType.BORDERLINE:
-                borderline.append(f"- {rule.rule_text}")
-        
-        return SYSTEM_PROMPT_TEMPLATE.format(
-            must_have_rules='\n'.join(must_have) or '- No specific requirements',
-            must_avoid_rules='\n'.join(must_avoid) or '- No specific exclusions',
-            good_topic_rules='\n'.join(good_topics) or '- No specific preferences',
-            borderline_rules='\n'.join(borderline) or '- Use general judgment',
-        )
+        return render_system_prompt(rules)
         
     finally:
         session.close()
 
 
+def render_system_prompt(rules: list[FilterRule]) -> str:
+    """
+    Format the system prompt for a list of filter rules.
+
+    Args:
+        rules: FilterRules to include, in the order they should be listed
+
+    Returns:
+        Formatted system prompt string
+    """
+    # Group rules by type
+    must_have = []
+    must_avoid = []
+    good_topics = []
+    borderline = []
+
+    for rule in rules:
+        if rule.rule_type == RuleType.MUST_HAVE:
+            must_have.append(f"- {rule.rule_text}")
+        elif rule.rule_type == RuleType.MUST_AVOID:
+            must_avoid.append(f"- {rule.rule_text}")
+        elif rule.rule_type == RuleType.GOOD_TOPIC:
+            good_topics.append(f"- {rule.rule_text}")
+        elif rule.rule_type == RuleType.BORDERLINE:
+            borderline.append(f"- {rule.rule_text}")
+    
+    return SYSTEM_PROMPT_TEMPLATE.format(
+        must_have_rules='\n'.join(must_have) or '- No specific requirements',
+        must_avoid_rules='\n'.join(must_avoid) or '- No specific exclusions',
+        good_topic_rules='\n'.join(good_topics) or '- No specific preferences',
+        borderline_rules='\n'.join(borderline) or '- Use general judgment',
+    )
+
+
 def filter_article_batch(articles: list[dict], system_prompt: str) -> list[dict]:
     """
     Filter a batch of articles through Claude with structured outputs.
@@ -345,20 +360,20 @@ def filter_all_articles(articles: list[dict]) -> tuple[list[dict], list[dict], d
         'cost_estimate': 0.0,
     }
 
-    total_batches = (len(articles) + BATCH_SIZE - 1) // BATCH_SIZE
-    _log_claude(f"Will process {total_batches} batches of up to {BATCH_SIZE} articles each")
+    batches = [articles[i:i + BATCH_SIZE] for i in range(0, len(articles), BATCH_SIZE)]
+    total_batches = len(batches)
+    _log_claude(
+        f"Will process {total_batches} batches of up to {BATCH_SIZE} articles each, "
+        f"{MAX_CONCURRENT_BATCHES} at a time"
+    )
 
-    # Process in batches
-    for i in range(0, len(articles), BATCH_SIZE):
-        batch = articles[i:i + BATCH_SIZE]
-        batch_num = i // BATCH_SIZE + 1
-        _log_claude(f"[BATCH {batch_num}/{total_batches}] Starting {len(batch)} articles...")
+    # Batches wait on Claude concurrently; map() still yields results in batch order
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_BATCHES) as pool:
+        batch_results = list(pool.map(filter_article_batch, batches, repeat(system_prompt)))
+    _log_claude(f"All {total_batches} batches complete in {time.time() - start:.1f}s")
 
-        batch_start = time.time()
-        results = filter_article_batch(batch, system_prompt)
-        batch_time = time.time() - batch_start
-        _log_claude(f"[BATCH {batch_num}/{total_batches}] Complete in {batch_time:.1f}s")
-        
+    for batch, results in zip(batches, batch_results):
         # Build index map from results
         results_by_index = {r.get('index', idx): r for idx, r in enumerate(results)}
         
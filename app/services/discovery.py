@@ -4,10 +4,12 @@ Discovery Service - Job Orchestration
 Orchestrates daily article discovery (RSS fetch only).
 Filtering is handled by the background filter worker.
 
-1. Fetch RSS feeds
+1. Fetch RSS feeds and store them, so the worker can start filtering
 2. Execute Exa searches  
 3. Deduplicate URLs
-4. Store candidates with filter_status='unfiltered'
+4. Store remaining candidates with filter_status='unfiltered'
+
+Each store notifies ARTICLES_INSERTED_CHANNEL to wake the filter worker.
 """
 
 import json
@@ -18,6 +20,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert
 
 logger = logging.getLogger(__name__)
@@ -35,12 +38,12 @@ def _log_progress(msg: str, start_time: float = None):
 # Delay imports to track where hangs occur
 def _import_dependencies(start_time: float):
     """Import dependencies with progress logging."""
-    global SessionLocal, Article, ArticleStatus, Source, FilterStatus
+    global SessionLocal, ARTICLES_INSERTED_CHANNEL, Article, ArticleStatus, Source, FilterStatus
     global fetch_all_rss_sources, search_all_queries
     global deduplicate_articles, normalize_url
 
     _log_progress("Importing database module...", start_time)
-    from app.database import SessionLocal
+    from app.database import SessionLocal, ARTICLES_INSERTED_CHANNEL
     _log_progress("Database module imported", start_time)
 
     _log_progress("Importing models...", start_time)
@@ -109,6 +112,20 @@ def run_discovery_job() -> dict:
             stats['errors'].append(f"RSS fetch: {e}")
             rss_articles = []
 
+        # Store RSS articles now so the filter worker runs while Exa searches
+        stored_urls = set()
+        if rss_articles:
+            rss_unique, _ = deduplicate_articles(rss_articles)
+            _log_progress(f"Step 1: Storing {len(rss_unique)} RSS articles...", job_start)
+            try:
+                stats['total_stored'] += store_unfiltered_articles(rss_unique)
+                stored_urls = {a['normalized_url'] for a in rss_unique}
+                _log_progress(f"Step 1: Storage complete - {stats['total_stored']} new articles queued for filtering", job_start)
+            except Exception as e:
+                _log_progress(f"Step 1: Storage FAILED - {e}", job_start)
+                logger.error(f"RSS storage failed: {e}")
+                stats['errors'].append(f"RSS storage: {e}")
+
         # Step 2: Execute Exa searches
         _log_progress("Step 2: Starting Exa searches...", job_start)
         try:
@@ -140,10 +157,11 @@ def run_discovery_job() -> dict:
 
         # Step 4: Store articles with filter_status='unfiltered'
         # Background worker will handle filtering
-        _log_progress(f"Step 4: Storing {len(unique_articles)} unfiltered articles...", job_start)
+        remaining = [a for a in unique_articles if a['normalized_url'] not in stored_urls]
+        _log_progress(f"Step 4: Storing {len(remaining)} unfiltered articles...", job_start)
         try:
-            stored_count = store_unfiltered_articles(unique_articles)
-            stats['total_stored'] = stored_count
+            stored_count = store_unfiltered_articles(remaining)
+            stats['total_stored'] += stored_count
             _log_progress(f"Step 4: Storage complete - {stored_count} new articles queued for filtering", job_start)
         except Exception as e:
             _log_progress(f"Step 4: Storage FAILED - {e}", job_start)
@@ -175,6 +193,7 @@ def store_unfiltered_articles(articles: list[dict]) -> int:
     Store articles with filter_status='unfiltered' for background worker processing.
 
     Uses INSERT ... ON CONFLICT DO NOTHING to handle any remaining duplicates.
+    Notifies ARTICLES_INSERTED_CHANNEL on commit when anything new was stored.
 
     Args:
         articles: List of article dicts from RSS/Exa
@@ -219,6 +238,9 @@ def store_unfiltered_articles(articles: list[dict]) -> int:
             if result.rowcount > 0:
                 stored_count += 1
 
+        if stored_count:
+            # Delivered on commit; wakes an idle filter worker
+            session.execute(select(func.pg_notify(ARTICLES_INSERTED_CHANNEL, str(stored_count))))
         session.commit()
         logger.info(f"Stored {stored_count}/{len(articles)} unfiltered articles")
 
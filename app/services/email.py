@@ -9,11 +9,13 @@ import logging
 import os
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail, From, To, Subject, HtmlContent, TrackingSettings, ClickTracking
+from sqlalchemy import insert
 
 from app.database import SessionLocal
 from app.models import Article, ArticleStatus, EmailBatch, EmailStatus
@@ -49,12 +51,19 @@ def get_sendgrid_client() -> SendGridAPIClient:
     return SendGridAPIClient(api_key=api_key)
 
 
+@lru_cache(maxsize=1)
 def get_template_env() -> Environment:
-    """Get Jinja2 environment for email templates."""
+    """
+    Get the shared Jinja2 environment for email templates.
+
+    Built once per process so each template is parsed only on first use.
+    Templates ship with the app, so there is no need to check them for changes.
+    """
     template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
     return Environment(
         loader=FileSystemLoader(template_dir),
-        autoescape=select_autoescape(['html', 'xml'])
+        autoescape=select_autoescape(['html', 'xml']),
+        auto_reload=False
     )
 
 
@@ -177,17 +186,17 @@ def create_email_batch(
     Returns:
         Created EmailBatch object
     """
-    batch = EmailBatch(
+    # RETURNING the whole row loads the server-generated id and created_at
+    # in the same round-trip as the INSERT
+    stmt = insert(EmailBatch).values(
         sent_at=datetime.now(timezone.utc),
         recipient_emails=[recipient_email],
         article_count=article_count,
         subject_line=subject,
         status=status,
         error_message=error_message,
-    )
-    session.add(batch)
-    session.flush()  # Get ID before commit
-    return batch
+    ).returning(EmailBatch)
+    return session.scalars(stmt).one()
 
 
 def update_articles_to_emailed(session, articles: list[Article], batch_id) -> int:
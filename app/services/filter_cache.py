@@ -0,0 +1,135 @@
+"""
+Filter Result Cache
+
+Reuses filter decisions for content that has already been evaluated.
+RSS feeds and Exa searches regularly resurface the same stories, and each
+filter runs at temperature 0, so a repeat Claude call only costs money.
+
+Keys include the filter's model and prompt (see filter_version()), so a model
+switch or prompt edit starts from an empty cache. Entries older than
+FILTER_CACHE_RETENTION_DAYS (default 30) are pruned with the trace cleanup.
+"""
+
+import hashlib
+import logging
+import os
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models import FilterCache
+
+logger = logging.getLogger(__name__)
+
+# Result fields that describe one API call rather than the decision itself
+METRIC_FIELDS = ('input_tokens', 'output_tokens', 'latency_ms')
+
+DEFAULT_RETENTION_DAYS = 30
+
+
+def content_hash(*parts: str) -> bytes:
+    """
+    Hash the inputs to a filter into a cache key.
+
+    Args:
+        parts: Strings that determine the filter's answer (title, content, rules)
+
+    Returns:
+        32-byte SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.strip().encode('utf-8'))
+        digest.update(b'\0')
+    return digest.digest()
+
+
+def filter_version(model: str, *prompts: str) -> str:
+    """
+    Identify the model and prompt a filter's cached answers came from.
+
+    Args:
+        model: Claude model the filter calls
+        prompts: Prompt templates the filter formats
+
+    Returns:
+        "<model>:<prompt digest>", for use as the first content_hash() part
+    """
+    return f"{model}:{content_hash(*prompts).hex()[:16]}"
+
+
+def get_cached_result(session, filter_name: str, key: bytes, result_cls, threshold: Optional[float] = None):
+    """
+    Look up a cached filter result.
+
+    Args:
+        session: Database session
+        filter_name: news_check, wow_factor, or values_fit
+        key: Cache key from content_hash()
+        result_cls: Result dataclass to rebuild (e.g. NewsCheckResult)
+        threshold: Current pass threshold for scored filters. The cached
+                   score is re-judged against it, so a threshold change
+                   applies to cached content too.
+
+    Returns:
+        result_cls instance with zeroed metrics, or None on a miss
+    """
+    stmt = select(FilterCache.result).where(
+        FilterCache.content_hash == key,
+        FilterCache.filter_name == filter_name
+    )
+    cached = session.execute(stmt).scalar_one_or_none()
+    if cached is None:
+        return None
+
+    if threshold is not None:
+        cached = {**cached, 'passed': cached['score'] >= threshold}
+    return result_cls(**cached, input_tokens=0, output_tokens=0, latency_ms=0)
+
+
+def store_result(session, filter_name: str, key: bytes, result) -> None:
+    """
+    Cache a filter result if it came from a successful Claude call.
+
+    Errors and empty-content short-circuits report zero input tokens and
+    are never cached, so they get retried the next time the content appears.
+
+    Args:
+        session: Database session (caller commits)
+        filter_name: news_check, wow_factor, or values_fit
+        key: Cache key from content_hash()
+        result: Filter result dataclass
+    """
+    if not result.input_tokens:
+        return
+
+    data = {k: v for k, v in asdict(result).items() if k not in METRIC_FIELDS}
+    stmt = insert(FilterCache).values(
+        content_hash=key,
+        filter_name=filter_name,
+        result=data
+    ).on_conflict_do_nothing()
+    session.execute(stmt)
+
+
+def prune_cache(session, retention_days: int = None) -> int:
+    """
+    Delete cached results older than the retention period.
+
+    Args:
+        session: Database session (caller commits)
+        retention_days: Days to keep. Defaults to FILTER_CACHE_RETENTION_DAYS
+                        env var or 30 days.
+
+    Returns:
+        Number of entries deleted
+    """
+    if retention_days is None:
+        retention_days = int(os.environ.get("FILTER_CACHE_RETENTION_DAYS", DEFAULT_RETENTION_DAYS))
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    result = session.execute(delete(FilterCache).where(FilterCache.created_at < cutoff))
+    return result.rowcount
@@ -0,0 +1,41 @@
+"""
+Filter Content Preparation
+
+Shared article-text handling for the three filter services. Orchestrators
+prepare an article's content once and pass the same string to every
+stage; preparing already-prepared content is a no-op.
+"""
+
+import re
+
+CONTENT_LIMIT = 8000  # Truncate articles to 8,000 characters
+TRUNCATION_MARKER = "\n\n[Content truncated...]"
+
+# Runs of spaces/tabs and of blank lines left behind by HTML-to-text scraping
+_INLINE_WHITESPACE = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\s*\n\s*\n\s*")
+
+
+def truncate_content(content: str, limit: int = CONTENT_LIMIT) -> str:
+    """Truncate content to specified character limit."""
+    if len(content) <= limit or content.endswith(TRUNCATION_MARKER):
+        return content
+    return content[:limit] + TRUNCATION_MARKER
+
+
+def prepare_content(content: str, limit: int = CONTENT_LIMIT) -> str:
+    """
+    Collapse scraped whitespace, then truncate to the filter content limit.
+
+    Args:
+        content: Raw article text (may be None or empty)
+        limit: Character limit before truncation
+
+    Returns:
+        Content ready to send to any filter stage
+    """
+    if not content:
+        return ''
+    content = _INLINE_WHITESPACE.sub(' ', content)
+    content = _BLANK_LINES.sub('\n\n', content)
+    return truncate_content(content.strip(), limit)
@@ -15,14 +15,15 @@ from typing import Optional
 
 from anthropic import Anthropic
 
+from app.services.filter_content import truncate_content
+
 logger = logging.getLogger(__name__)
 
 # Configuration
-# Note: Using Sonnet because Haiku doesn't support structured outputs
-MODEL = os.environ.get("FILTER_NEWS_CHECK_MODEL", "claude-sonnet-4-5")
+# Haiku: a binary gatekeeping call on the highest-volume stage
+MODEL = os.environ.get("FILTER_NEWS_CHECK_MODEL", "claude-haiku-4-5")
 MAX_TOKENS = 1024
 TEMPERATURE = 0
-CONTENT_LIMIT = 8000  # Truncate articles to 8,000 characters
 
 # Anthropic beta API version for structured outputs
 STRUCTURED_OUTPUTS_BETA = os.environ.get(
@@ -95,13 +96,6 @@ class NewsCheckResult:
     latency_ms: Optional[int] = None
 
 
-def truncate_content(content: str, limit: int = CONTENT_LIMIT) -> str:
-    """Truncate content to specified character limit."""
-    if len(content) <= limit:
-        return content
-    return content[:limit] + "\n\n[Content truncated...]"
-
-
 def filter_news_check(article: dict) -> NewsCheckResult:
     """
     Evaluate if an article is actual news content.
@@ -137,7 +131,7 @@ def filter_news_check(article: dict) -> NewsCheckResult:
         content=content
     )
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         response = client.beta.messages.create(
@@ -154,7 +148,7 @@ def filter_news_check(article: dict) -> NewsCheckResult:
             }
         )
         
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Parse response
         import json
@@ -171,7 +165,7 @@ def filter_news_check(article: dict) -> NewsCheckResult:
         
     except Exception as e:
         logger.error(f"News check filter error for {url}: {e}")
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return NewsCheckResult(
             passed=False,
             category="other_non_news",
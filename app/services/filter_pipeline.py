@@ -14,9 +14,10 @@ from uuid import UUID
 
 from app.database import SessionLocal
 from app.models import PipelineRun, FilterTrace, PipelineRunStatus
+from app.services.filter_content import prepare_content
 from app.services.filter_news_check import filter_news_check, NewsCheckResult
 from app.services.filter_wow_factor import filter_wow_factor, WowFactorResult
-from app.services.filter_values_fit import filter_values_fit, load_filter_rules, ValuesFitResult
+from app.services.filter_values_fit import filter_values_fit, load_filter_rules, render_rules_prompt, ValuesFitResult
 
 logger = logging.getLogger(__name__)
 
@@ -179,8 +180,8 @@ def run_pipeline(articles: list[dict]) -> PipelineResult:
         run = create_pipeline_run(session, len(articles))
         run_id = run.id
         
-        # Load filter rules once for all articles
-        rules = load_filter_rules()
+        # Load filter rules and render the shared prompt prefix once for all articles
+        rules_prompt = render_rules_prompt(load_filter_rules())
         
         # Track results at each stage
         passed_articles = []
@@ -195,6 +196,7 @@ def run_pipeline(articles: list[dict]) -> PipelineResult:
         for article in articles:
             url = article.get('url', '')
             title = article.get('title', 'Untitled')
+            article = {**article, 'content': prepare_content(article.get('content'))}
             
             try:
                 # =========================================
@@ -269,7 +271,7 @@ def run_pipeline(articles: list[dict]) -> PipelineResult:
                 # =========================================
                 # FILTER 3: Values Fit
                 # =========================================
-                result3 = filter_values_fit(article, rules)
+                result3 = filter_values_fit(article, rules_prompt=rules_prompt)
                 
                 record_trace(
                     session=session,
@@ -401,10 +403,11 @@ def run_pipeline_for_article(article) -> SingleArticleResult:
     article_data = {
         'url': article.external_url,
         'title': article.headline,
-        'content': article.raw_content or ''
+        # Prepared once here; every stage sees (and caches on) the same text
+        'content': prepare_content(article.raw_content)
     }
     
-    # Load filter rules
+    # Load filter rules (memoized across articles)
     rules = load_filter_rules()
     
     # =========================================
@@ -17,15 +17,17 @@ from anthropic import Anthropic
 
 from app.database import SessionLocal
 from app.models import FilterRule, RuleType
+from app.services.filter_content import truncate_content
 
 logger = logging.getLogger(__name__)
 
 # Configuration
+# Sonnet: the final, most nuanced judgement is worth the stronger model
 MODEL = os.environ.get("FILTER_VALUES_FIT_MODEL", "claude-sonnet-4-5")
 MAX_TOKENS = 1024
 TEMPERATURE = 0
-CONTENT_LIMIT = 8000  # Truncate articles to 8,000 characters
 VALUES_THRESHOLD = float(os.environ.get("FILTER_VALUES_THRESHOLD", "0.5"))
+RULES_CACHE_SECONDS = int(os.environ.get("FILTER_RULES_CACHE_SECONDS", "300"))
 
 # Anthropic beta API version for structured outputs
 STRUCTURED_OUTPUTS_BETA = os.environ.get(
@@ -50,7 +52,9 @@ VALUES_FIT_SCHEMA = {
     "additionalProperties": False
 }
 
-VALUES_FIT_PROMPT_TEMPLATE = """You are evaluating news stories for alignment with Amish/conservative Christian values.
+# Prompt is split so the instructions + rules (identical for every article)
+# can be sent as a cached prefix ahead of the per-article part.
+VALUES_FIT_RULES_TEMPLATE = """You are evaluating news stories for alignment with Amish/conservative Christian values.
 
 This publication serves Plain News readers - Amish and conservative Mennonite communities. Stories should be wholesome, relatable, and written at an 8th-grade reading level.
 
@@ -66,9 +70,9 @@ Score the values fit from 0.0 to 1.0:
 - 0.2-0.4: Poor fit - some inappropriate elements or conflicts with values
 - 0.0-0.2: Reject - contains forbidden topics or conflicts with core values
 
-DO NOT consider if the story is interesting or surprising - ONLY evaluate if it fits the values criteria above.
+DO NOT consider if the story is interesting or surprising - ONLY evaluate if it fits the values criteria above."""
 
-Evaluate this story:
+VALUES_FIT_ARTICLE_TEMPLATE = """Evaluate this story:
 
 TITLE: {title}
 
@@ -89,20 +93,24 @@ class ValuesFitResult:
     latency_ms: Optional[int] = None
 
 
-def truncate_content(content: str, limit: int = CONTENT_LIMIT) -> str:
-    """Truncate content to specified character limit."""
-    if len(content) <= limit:
-        return content
-    return content[:limit] + "\n\n[Content truncated...]"
+# (loaded_at, rules) from the last load_filter_rules() query
+_rules_cache: Optional[tuple[float, dict]] = None
 
 
 def load_filter_rules() -> dict:
     """
     Load must_have and must_avoid rules from the FilterRule table.
     
+    Results are memoized for RULES_CACHE_SECONDS so per-article callers
+    don't query the table every time; rule edits show up after expiry.
+    
     Returns:
         Dict with 'must_have' and 'must_avoid' lists of rule texts
     """
+    global _rules_cache
+    if _rules_cache is not None and time.monotonic() - _rules_cache[0] < RULES_CACHE_SECONDS:
+        return _rules_cache[1]
+    
     session = SessionLocal()
     try:
         rules = session.query(FilterRule).filter(FilterRule.is_active == True).all()
@@ -138,49 +146,75 @@ def load_filter_rules() -> dict:
                 "- Military, war, international conflict"
             ]
         
-        return {
+        rules = {
             "must_have": must_have,
             "must_avoid": must_avoid
         }
+        _rules_cache = (time.monotonic(), rules)
+        return rules
     finally:
         session.close()
 
 
-def filter_values_fit(article: dict, rules: Optional[dict] = None) -> ValuesFitResult:
+def render_rules_prompt(rules: dict) -> str:
+    """
+    Render the instructions + rules part of the values fit prompt.
+    
+    Callers filtering many articles should render this once and pass it to
+    filter_values_fit() as rules_prompt.
+    
+    Args:
+        rules: Dict with 'must_have' and 'must_avoid' lists
+        
+    Returns:
+        Prompt prefix shared by every article
+    """
+    return VALUES_FIT_RULES_TEMPLATE.format(
+        must_have_rules="\n".join(rules.get("must_have", [])),
+        must_avoid_rules="\n".join(rules.get("must_avoid", []))
+    )
+
+
+def filter_values_fit(
+    article: dict,
+    rules: Optional[dict] = None,
+    rules_prompt: Optional[str] = None
+) -> ValuesFitResult:
     """
     Evaluate if an article fits Amish/conservative values.
     
+    The rules part of the prompt is marked for Anthropic prompt caching, so
+    repeated calls only pay full price for the per-article part.
+    
     Args:
         article: Dict with 'title', 'content' keys
         rules: Optional dict with 'must_have' and 'must_avoid' lists.
                If not provided, loads from database.
+        rules_prompt: Optional output of render_rules_prompt(); takes
+                      precedence over rules.
         
     Returns:
         ValuesFitResult with passed status, score, reasoning, and metrics
     """
     client = Anthropic()
     
-    # Load rules if not provided
-    if rules is None:
-        rules = load_filter_rules()
+    # Render rules if not provided
+    if rules_prompt is None:
+        if rules is None:
+            rules = load_filter_rules()
+        rules_prompt = render_rules_prompt(rules)
     
     # Prepare content
     title = article.get('title', 'Untitled')
     content = truncate_content(article.get('content', ''))
     
-    # Format rules as bullet lists
-    must_have_text = "\n".join(rules.get("must_have", []))
-    must_avoid_text = "\n".join(rules.get("must_avoid", []))
-    
-    # Format prompt
-    prompt = VALUES_FIT_PROMPT_TEMPLATE.format(
-        must_have_rules=must_have_text,
-        must_avoid_rules=must_avoid_text,
+    # Format per-article part of the prompt
+    article_prompt = VALUES_FIT_ARTICLE_TEMPLATE.format(
         title=title,
         content=content
     )
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         response = client.beta.messages.create(
@@ -189,7 +223,13 @@ def filter_values_fit(article: dict, rules: Optional[dict] = None) -> ValuesFitR
             temperature=TEMPERATURE,
             betas=[STRUCTURED_OUTPUTS_BETA],
             messages=[
-                {"role": "user", "content": prompt}
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": rules_prompt, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": article_prompt}
+                    ]
+                }
             ],
             output_format={
                 "type": "json_schema",
@@ -197,7 +237,7 @@ def filter_values_fit(article: dict, rules: Optional[dict] = None) -> ValuesFitR
             }
         )
         
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Parse response
         import json
@@ -218,7 +258,7 @@ def filter_values_fit(article: dict, rules: Optional[dict] = None) -> ValuesFitR
         
     except Exception as e:
         logger.error(f"Values fit filter error for '{title}': {e}")
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return ValuesFitResult(
             passed=False,
             score=0.0,
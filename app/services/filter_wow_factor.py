@@ -15,14 +15,22 @@ from typing import Optional
 
 from anthropic import Anthropic
 
+from app.services.filter_content import truncate_content
+
 logger = logging.getLogger(__name__)
 
+
+def _load_threshold() -> float:
+    """Read the pass threshold from FILTER_WOW_THRESHOLD (default 0.5)"""
+    return float(os.environ.get("FILTER_WOW_THRESHOLD", "0.5"))
+
+
 # Configuration
-MODEL = os.environ.get("FILTER_WOW_FACTOR_MODEL", "claude-sonnet-4-5")
+# Haiku: a coarse score gate ahead of the values fit stage
+MODEL = os.environ.get("FILTER_WOW_FACTOR_MODEL", "claude-haiku-4-5")
 MAX_TOKENS = 1024
 TEMPERATURE = 0
-CONTENT_LIMIT = 8000  # Truncate articles to 8,000 characters
-WOW_THRESHOLD = float(os.environ.get("FILTER_WOW_THRESHOLD", "0.5"))
+WOW_THRESHOLD = _load_threshold()
 
 # Anthropic beta API version for structured outputs
 STRUCTURED_OUTPUTS_BETA = os.environ.get(
@@ -95,13 +103,6 @@ class WowFactorResult:
     latency_ms: Optional[int] = None
 
 
-def truncate_content(content: str, limit: int = CONTENT_LIMIT) -> str:
-    """Truncate content to specified character limit."""
-    if len(content) <= limit:
-        return content
-    return content[:limit] + "\n\n[Content truncated...]"
-
-
 def filter_wow_factor(article: dict) -> WowFactorResult:
     """
     Evaluate if an article has high wow factor.
@@ -124,7 +125,7 @@ def filter_wow_factor(article: dict) -> WowFactorResult:
         content=content
     )
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         response = client.beta.messages.create(
@@ -141,7 +142,7 @@ def filter_wow_factor(article: dict) -> WowFactorResult:
             }
         )
         
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         # Parse response
         import json
@@ -162,7 +163,7 @@ def filter_wow_factor(article: dict) -> WowFactorResult:
         
     except Exception as e:
         logger.error(f"Wow factor filter error for '{title}': {e}")
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         return WowFactorResult(
             passed=False,
             score=0.0,
@@ -6,25 +6,29 @@ Removes tracking parameters, standardizes protocols and domains.
 """
 
 import logging
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 logger = logging.getLogger(__name__)
 
 # Query parameters to preserve (article identifiers)
-PRESERVE_PARAMS = {'id', 'article', 'p', 'story', 'post', 'page'}
+PRESERVE_PARAMS = frozenset({'id', 'article', 'p', 'story', 'post', 'page'})
 
 # Query parameters to always remove (tracking)
-REMOVE_PARAMS = {
+REMOVE_PARAMS = frozenset({
     'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
     'fbclid', 'gclid', 'ref', 'source', 'mc_cid', 'mc_eid',
     '_ga', '_gl', 'ncid', 'ocid', 'sr_share',
-}
+})
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     """
     Normalize a URL for deduplication.
     
+    Memoized: feeds resurface the same URLs on every poll.
+    
     Normalization rules:
     1. Convert to lowercase
     2. Standardize to https://
@@ -42,6 +46,12 @@ def normalize_url(url: str) -> str:
     if not url:
         return ''
     
+    # Most feed URLs are already normalized; spot them without parsing
+    if (url[:8] == 'https://' and url[8:9] != '/' and url[8:12] != 'www.' and url.islower()
+            and url.isprintable() and url[-1] not in '/ '
+            and not any(c in url for c in '?#;')):
+        return url
+    
     try:
         # Parse URL
         parsed = urlparse(url.lower().strip())
@@ -59,15 +69,13 @@ def normalize_url(url: str) -> str:
         # Filter query parameters
         if parsed.query:
             params = parse_qs(parsed.query, keep_blank_values=False)
-            filtered_params = {}
-            for key, values in params.items():
-                key_lower = key.lower()
-                # Keep only essential params, remove tracking
-                if key_lower in PRESERVE_PARAMS:
-                    filtered_params[key] = values
-                elif key_lower not in REMOVE_PARAMS:
-                    # Keep unknown params (might be important)
-                    filtered_params[key] = values
+            # Keep essential and unknown params (might be important), remove
+            # tracking. parse_qs/urlencode stay: normalized URLs are stored
+            # as external_url, so their encoding must not change.
+            filtered_params = {
+                key: values for key, values in params.items()
+                if key.lower() in PRESERVE_PARAMS or key.lower() not in REMOVE_PARAMS
+            }
             query = urlencode(filtered_params, doseq=True) if filtered_params else ''
         else:
             query = ''
@@ -0,0 +1,46 @@
+"""Add unique index on filter_rules.rule_text
+
+Revision ID: a6d0e4f8b3c7
+Revises: f5c9d3e7a2b6
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d0e4f8b3c7'
+down_revision: Union[str, None] = 'f5c9d3e7a2b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Let seed_data skip existing rules with ON CONFLICT (rule_text)."""
+    # Rules added outside seed_data may repeat a rule_text, which would fail
+    # the unique index. Keep the oldest row of each, active if any copy was.
+    op.execute(sa.text("""
+        WITH ranked AS (
+            SELECT id,
+                   row_number() OVER (PARTITION BY rule_text ORDER BY created_at, id) AS rn,
+                   bool_or(is_active) OVER (PARTITION BY rule_text) AS any_active
+            FROM filter_rules
+        ),
+        kept AS (
+            UPDATE filter_rules
+            SET is_active = ranked.any_active
+            FROM ranked
+            WHERE filter_rules.id = ranked.id AND ranked.rn = 1
+        )
+        DELETE FROM filter_rules
+        USING ranked
+        WHERE filter_rules.id = ranked.id AND ranked.rn > 1
+    """))
+    op.create_index('ix_filter_rules_rule_text', 'filter_rules', ['rule_text'], unique=True)
+
+
+def downgrade() -> None:
+    """Remove filter_rules rule_text unique index."""
+    op.drop_index('ix_filter_rules_rule_text', table_name='filter_rules')
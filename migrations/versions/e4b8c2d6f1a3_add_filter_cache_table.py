@@ -0,0 +1,35 @@
+"""Add filter cache table
+
+Revision ID: e4b8c2d6f1a3
+Revises: fdb9e7602bf7
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c2d6f1a3'
+down_revision: Union[str, None] = 'fdb9e7602bf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add filter_cache table for reusing filter decisions on duplicate content."""
+    op.create_table(
+        'filter_cache',
+        sa.Column('content_hash', sa.LargeBinary(), nullable=False),
+        sa.Column('filter_name', sa.String(50), nullable=False),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('content_hash', 'filter_name')
+    )
+
+
+def downgrade() -> None:
+    """Remove filter_cache table."""
+    op.drop_table('filter_cache')
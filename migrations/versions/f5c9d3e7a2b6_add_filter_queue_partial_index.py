@@ -0,0 +1,37 @@
+"""Add partial index for filter worker queue
+
+Revision ID: f5c9d3e7a2b6
+Revises: e4b8c2d6f1a3
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c9d3e7a2b6'
+down_revision: Union[str, None] = 'e4b8c2d6f1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index unfiltered articles in the order the filter worker claims them."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_filter_queue',
+            'articles',
+            ['created_at'],
+            unique=False,
+            postgresql_where=sa.text("filter_status = 'unfiltered'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Remove filter worker queue index."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_articles_filter_queue', table_name='articles', postgresql_concurrently=True)
@@ -15,6 +15,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from datetime import datetime, timezone, timedelta
+from sqlalchemy import func, select
 from app.database import SessionLocal
 from app.models import Article, ArticleStatus, FilterStatus, PipelineRun
 
@@ -29,21 +30,27 @@ def main():
         
         # Check filter_status counts
         print("\n📊 Filter Status Breakdown:")
+        filter_counts = dict(session.execute(
+            select(Article.filter_status, func.count()).group_by(Article.filter_status)
+        ).all())
         for status in FilterStatus:
-            count = session.query(Article).filter(Article.filter_status == status).count()
+            count = filter_counts.get(status, 0)
             print(f"  {status.value:15} : {count:5}")
         
         # Check article status counts
         print("\n📊 Article Status Breakdown:")
+        status_counts = dict(session.execute(
+            select(Article.status, func.count()).group_by(Article.status)
+        ).all())
         for status in ArticleStatus:
-            count = session.query(Article).filter(Article.status == status).count()
+            count = status_counts.get(status, 0)
             print(f"  {status.value:15} : {count:5}")
         
         # Check articles from today
         today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_articles = session.query(Article).filter(
-            Article.discovered_date >= today_start
-        ).count()
+        today_articles = session.execute(
+            select(func.count()).select_from(Article).where(Article.discovered_date >= today_start)
+        ).scalar()
         print(f"\n📅 Articles discovered today: {today_articles}")
         
         # Check recent unfiltered articles
@@ -61,9 +68,7 @@ def main():
             print("\n✅ No unfiltered articles in queue")
         
         # Check for articles stuck in 'filtering' state
-        filtering = session.query(Article).filter(
-            Article.filter_status == FilterStatus.FILTERING
-        ).count()
+        filtering = filter_counts.get(FilterStatus.FILTERING, 0)
         if filtering > 0:
             print(f"\n⚠️  {filtering} articles stuck in 'filtering' state (worker may have crashed)")
         
@@ -83,9 +88,7 @@ def main():
         print("\n" + "=" * 60)
         
         # Recommendation
-        unfiltered_count = session.query(Article).filter(
-            Article.filter_status == FilterStatus.UNFILTERED
-        ).count()
+        unfiltered_count = filter_counts.get(FilterStatus.UNFILTERED, 0)
         
         if unfiltered_count > 0:
             print("\n⚠️  ISSUE DETECTED:")
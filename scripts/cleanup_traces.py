@@ -2,7 +2,8 @@
 """
 Cleanup script for filter pipeline traces.
 
-Deletes FilterTrace and PipelineRun records older than 7 days.
+Deletes FilterTrace and PipelineRun records older than 7 days, and filter
+cache entries older than 30 days.
 Should be run daily via cron or Railway scheduled job.
 
 Usage:
@@ -11,6 +12,7 @@ Usage:
 Environment:
     DATABASE_URL - PostgreSQL connection string
     TRACE_RETENTION_DAYS - Override default 7-day retention (optional)
+    FILTER_CACHE_RETENTION_DAYS - Override default 30-day cache retention (optional)
 """
 
 import logging
@@ -23,6 +25,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal
 from app.models import FilterTrace, PipelineRun
+from app.services.filter_cache import prune_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -58,6 +61,7 @@ def cleanup_old_traces(retention_days: int = None) -> dict:
     stats = {
         'traces_deleted': 0,
         'runs_deleted': 0,
+        'cache_deleted': 0,
         'retention_days': retention_days,
         'cutoff_date': cutoff.isoformat()
     }
@@ -87,8 +91,12 @@ def cleanup_old_traces(retention_days: int = None) -> dict:
         stats['runs_deleted'] = len(orphan_runs)
         logger.info(f"Deleted {len(orphan_runs)} orphaned pipeline runs")
         
+        # Step 3: Delete stale filter cache entries (own retention period)
+        stats['cache_deleted'] = prune_cache(session)
+        logger.info(f"Deleted {stats['cache_deleted']} filter cache entries")
+        
         session.commit()
-        logger.info(f"Cleanup complete - {stats['traces_deleted']} traces, {stats['runs_deleted']} runs deleted")
+        logger.info(f"Cleanup complete - {stats['traces_deleted']} traces, {stats['runs_deleted']} runs, {stats['cache_deleted']} cache entries deleted")
         
     except Exception as e:
         logger.error(f"Cleanup failed: {e}")
@@ -141,7 +149,7 @@ def main():
             session.close()
     else:
         stats = cleanup_old_traces(args.days)
-        print(f"Cleanup complete: {stats['traces_deleted']} traces, {stats['runs_deleted']} runs deleted")
+        print(f"Cleanup complete: {stats['traces_deleted']} traces, {stats['runs_deleted']} runs, {stats['cache_deleted']} cache entries deleted")
 
 
 if __name__ == '__main__':
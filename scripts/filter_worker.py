@@ -4,22 +4,31 @@ Background Filter Worker
 
 Continuously processes unfiltered articles through the multi-stage filtering pipeline.
 Runs as a persistent Railway worker service - no timeout constraints.
+Database access goes through an async (asyncpg) session so it can overlap with
+in-flight Claude calls on the same event loop.
 Records all filter decisions to enable funnel analysis via /admin/filter-runs.
 
 Usage:
     python scripts/filter_worker.py
 
 Environment:
-    FILTER_WORKER_SLEEP_INTERVAL - Seconds to sleep when idle (default: 60)
-    FILTER_WORKER_BATCH_SIZE - Articles to claim per cycle (default: 1)
+    FILTER_WORKER_SLEEP_INTERVAL - Seconds to sleep when idle, unless discovery
+        signals new articles sooner (default: 60)
+    FILTER_WORKER_BATCH_SIZE - Articles to claim and filter concurrently per cycle (default: 8)
+    FILTER_WORKER_COMMIT_INTERVAL - Articles to process between commits (default: 10)
 """
 
+import asyncio
 import logging
 import os
+import queue
 import signal
 import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Optional
 from uuid import UUID
 
 # Add project root to path
@@ -28,18 +37,72 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import SessionLocal
+from app.database import ARTICLES_INSERTED_CHANNEL, create_async_db_engine
 from app.models import Article, ArticleStatus, FilterStatus, PipelineRun, PipelineRunStatus, FilterTrace
-from app.services.filter_news_check import filter_news_check
-from app.services.filter_wow_factor import filter_wow_factor
-from app.services.filter_values_fit import filter_values_fit, load_filter_rules
+from app.services import filter_news_check as news_check, filter_values_fit as values_fit, filter_wow_factor as wow_factor
+from app.services.filter_cache import content_hash, filter_version, get_cached_result, store_result
+from app.services.filter_content import prepare_content
+from app.services.filter_news_check import filter_news_check, NewsCheckResult
+from app.services.filter_wow_factor import filter_wow_factor, WowFactorResult
+from app.services.filter_values_fit import filter_values_fit, load_filter_rules, render_rules_prompt, ValuesFitResult
 
 # Configuration
 SLEEP_INTERVAL = int(os.environ.get("FILTER_WORKER_SLEEP_INTERVAL", "60"))
-BATCH_SIZE = int(os.environ.get("FILTER_WORKER_BATCH_SIZE", "1"))
+BATCH_SIZE = int(os.environ.get("FILTER_WORKER_BATCH_SIZE", "8"))
+COMMIT_INTERVAL = int(os.environ.get("FILTER_WORKER_COMMIT_INTERVAL", "10"))
+
+@dataclass(frozen=True)
+class FilterStage:
+    """One stage of the worker's filter cascade."""
+    name: str
+    order: int
+    filter_fn: Callable
+    result_cls: type
+    version: str  # Model and prompt digest, part of every cache key
+    score_field: Optional[str] = None  # Article column that records the stage's score
+    threshold: Optional[float] = None  # Pass mark cached scores are re-judged against
+    uses_rules: bool = False  # Called with (and cached on) the rendered rules prompt
+
+
+# Stages run in order and an article stops at its first rejection. News check
+# gates the rest and values fit is the priciest call (Sonnet, longest prompt),
+# so cheapest-first is also the funnel order STAGE_PASS_COUNTS reports.
+FILTER_PIPELINE = [
+    FilterStage(
+        "news_check", 1, filter_news_check, NewsCheckResult,
+        version=filter_version(news_check.MODEL, news_check.NEWS_CHECK_PROMPT),
+    ),
+    FilterStage(
+        "wow_factor", 2, filter_wow_factor, WowFactorResult,
+        version=filter_version(wow_factor.MODEL, wow_factor.WOW_FACTOR_PROMPT),
+        score_field="wow_score", threshold=wow_factor.WOW_THRESHOLD,
+    ),
+    FilterStage(
+        "values_fit", 3, filter_values_fit, ValuesFitResult,
+        version=filter_version(values_fit.MODEL, values_fit.VALUES_FIT_RULES_TEMPLATE, values_fit.VALUES_FIT_ARTICLE_TEMPLATE),
+        score_field="filter_score", threshold=values_fit.VALUES_THRESHOLD, uses_rules=True,
+    ),
+]
+
+# Pass-count increments (filter1, filter2, filter3) by rejection stage.
+# None means the article passed every filter.
+STAGE_PASS_COUNTS = {
+    "news_check": (0, 0, 0),
+    "news_check_error": (0, 0, 0),
+    "wow_factor": (1, 0, 0),
+    "wow_factor_error": (1, 0, 0),
+    "values_fit": (1, 1, 0),
+    "values_fit_error": (1, 1, 0),
+    None: (1, 1, 1),
+}
+
+# Async engine for the worker. Objects stay loaded after commit because the
+# worker keeps using claimed articles across commits.
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 # Configure logging
 logging.basicConfig(
@@ -61,6 +124,21 @@ current_run: PipelineRun = None
 current_run_id: UUID = None
 
 
+def start_log_listener() -> QueueListener:
+    """
+    Hand log records to a background thread that writes them to stdout.
+
+    Keeps the event loop from blocking on stdout writes while articles
+    are in flight. Call stop() on the returned listener to flush it.
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     global shutdown_requested
@@ -68,21 +146,20 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
-def create_worker_run(session: Session, queue_size: int) -> PipelineRun:
+async def create_worker_run(session: AsyncSession, queue_size: int) -> PipelineRun:
     """Create a new PipelineRun for this worker session."""
     run = PipelineRun(
         status=PipelineRunStatus.RUNNING,
         input_count=queue_size
     )
     session.add(run)
-    session.commit()
-    session.refresh(run)
+    await session.commit()
+    await session.refresh(run)
     logger.info(f"Created worker run {run.id} (queue size: {queue_size})")
     return run
 
 
 def record_trace(
-    session: Session,
     run_id: UUID,
     article: Article,
     filter_name: str,
@@ -93,213 +170,293 @@ def record_trace(
     input_tokens: int = None,
     output_tokens: int = None,
     latency_ms: int = None
-):
-    """Record a filter decision trace."""
+) -> FilterTrace:
+    """Build a filter decision trace for the caller to bulk-save."""
     trace = FilterTrace(
         run_id=run_id,
         article_url=article.external_url,
-        article_title=article.headline[:500],
+        article_title=article.headline,  # Already bounded by Article.headline's String(500)
         filter_name=filter_name,
         filter_order=filter_order,
         decision=decision,
         score=score,
-        reasoning=reasoning[:2000] if reasoning else "",
+        reasoning=reasoning[:2000] if reasoning else "",  # Slicing a short str returns it uncopied
         input_tokens=input_tokens,
         output_tokens=output_tokens,
         latency_ms=latency_ms
     )
-    session.add(trace)
-    # Don't commit yet - let caller batch commits
+    return trace
 
 
-def update_run_counts(session: Session, run: PipelineRun, f1: int, f2: int, f3: int):
-    """Update the pipeline run with current counts."""
-    run.filter1_pass_count = f1
-    run.filter2_pass_count = f2
-    run.filter3_pass_count = f3
-    session.commit()
+async def update_run_counts(session: AsyncSession, run_id: UUID, f1: int, f2: int, f3: int):
+    """Update the pipeline run with current counts (a bare UPDATE, no SELECT)."""
+    await session.execute(
+        update(PipelineRun)
+        .where(PipelineRun.id == run_id)
+        .values(filter1_pass_count=f1, filter2_pass_count=f2, filter3_pass_count=f3)
+    )
+    await session.commit()
 
 
-def finalize_run(session: Session, run: PipelineRun, status: PipelineRunStatus, error: str = None):
+async def finalize_run(session: AsyncSession, run: PipelineRun, status: PipelineRunStatus, error: str = None):
     """Mark the pipeline run as complete."""
     run.status = status
     run.completed_at = datetime.now(timezone.utc)
     run.error_message = error
-    session.commit()
+    await session.commit()
     logger.info(f"Finalized run {run.id}: {status.value}")
 
 
-def claim_next_article(session: Session) -> Article | None:
+async def claim_articles(session: AsyncSession, n: int) -> list[Article]:
     """
-    Atomically claim the next unfiltered article for processing.
+    Atomically claim up to n unfiltered articles for processing, oldest first.
     Uses SELECT FOR UPDATE SKIP LOCKED to prevent race conditions.
+    RETURNING * hydrates the Article objects in the same round-trip.
+    
+    The candidates are picked in a MATERIALIZED CTE: as an IN (...) subquery
+    the planner may re-run the LIMIT and claim more than n rows.
     """
     stmt = text("""
-        UPDATE articles 
-        SET filter_status = 'filtering'
-        WHERE id = (
+        WITH claimed AS MATERIALIZED (
             SELECT id FROM articles 
             WHERE filter_status = 'unfiltered'
-            LIMIT 1
+            ORDER BY created_at
+            LIMIT :n
             FOR UPDATE SKIP LOCKED
         )
-        RETURNING id
+        UPDATE articles 
+        SET filter_status = 'filtering'
+        FROM claimed
+        WHERE articles.id = claimed.id
+        RETURNING articles.*
     """)
     
-    result = session.execute(stmt)
-    row = result.fetchone()
+    result = await session.execute(select(Article).from_statement(stmt), {"n": n})
+    articles = list(result.scalars())
     
-    if row is None:
-        return None
+    if articles:
+        await session.commit()
+    return articles
+
+
+async def run_cached_filter(stage: FilterStage, key: bytes, *args, **kwargs):
+    """
+    Return the cached result for key, or run the stage's filter in a worker thread and cache it.
     
-    session.commit()
-    article = session.query(Article).filter(Article.id == row[0]).first()
-    return article
+    Uses its own short-lived sessions: an AsyncSession cannot be shared by
+    concurrently running article tasks. The cache only saves Claude calls,
+    so a failed lookup counts as a miss and a failed store is just logged.
+    """
+    cached = None
+    try:
+        async with AsyncSessionLocal() as cache_session:
+            cached = await cache_session.run_sync(get_cached_result, stage.name, key, stage.result_cls, stage.threshold)
+    except Exception as e:
+        logger.warning(f"Cache lookup failed for {stage.name}, calling Claude: {e}")
+    if cached is not None:
+        logger.info(f"Cache hit for {stage.name}")
+        return cached
+    
+    result = await asyncio.to_thread(stage.filter_fn, *args, **kwargs)
+    
+    try:
+        async with AsyncSessionLocal() as cache_session:
+            await cache_session.run_sync(store_result, stage.name, key, result)
+            await cache_session.commit()
+    except Exception as e:
+        logger.warning(f"Could not cache {stage.name} result: {e}")
+    return result
 
 
-def process_article_with_tracing(session: Session, article: Article, run_id: UUID, rules: dict) -> tuple[bool, str]:
+async def process_article_with_tracing(
+    article: Article, run_id: UUID, rules_prompt: str, traces: list[FilterTrace]
+) -> tuple[bool, str, dict]:
     """
-    Process a single article through all filters with full tracing.
+    Process a single article through FILTER_PIPELINE with full tracing.
+    
+    Claude calls run in worker threads so a batch of articles can wait on
+    the API concurrently. The article itself is left untouched: an
+    AsyncSession flush yields to the event loop, and attribute changes made
+    by another task mid-flush would be lost. Field updates are returned for
+    the caller to apply, and traces are appended to traces for bulk saving.
     
     Returns:
-        (passed: bool, rejection_stage: str or None)
+        (passed: bool, rejection_stage: str or None, updates: dict of Article fields)
     """
     article_data = {
         'url': article.external_url,
         'title': article.headline,
-        'content': article.raw_content or ''
+        # Prepared once here; every stage sees (and caches on) the same text
+        'content': prepare_content(article.raw_content)
     }
+    updates = {}
     
-    # =========================================
-    # FILTER 1: News Check
-    # =========================================
-    try:
-        start_ms = int(time.time() * 1000)
-        result1 = filter_news_check(article_data)
-        latency1 = int(time.time() * 1000) - start_ms
-        
-        record_trace(
-            session, run_id, article,
-            filter_name="news_check",
-            filter_order=1,
-            decision="pass" if result1.passed else "reject",
-            reasoning=result1.reasoning,
-            input_tokens=result1.input_tokens,
-            output_tokens=result1.output_tokens,
-            latency_ms=latency1
-        )
-        
-        if not result1.passed:
-            article.content_type = result1.category
-            article.filter_score = 0.0
-            article.filter_notes = f"Rejected at news_check: {result1.reasoning}"
-            return False, "news_check"
+    for stage in FILTER_PIPELINE:
+        try:
+            # Cache key: the stage's model and prompt, the article, and for values fit the rules
+            key_parts = [stage.version, article_data['title'], article_data['content']]
+            kwargs = {}
+            if stage.uses_rules:
+                key_parts.append(rules_prompt)
+                kwargs['rules_prompt'] = rules_prompt
             
-    except Exception as e:
-        logger.error(f"News check error: {e}")
-        article.filter_notes = f"Error in news_check: {e}"
-        return False, "news_check_error"
+            start_ns = time.perf_counter_ns()
+            result = await run_cached_filter(stage, content_hash(*key_parts), article_data, **kwargs)
+            latency = (time.perf_counter_ns() - start_ns) // 1_000_000
+            
+            score = getattr(result, 'score', None)
+            traces.append(record_trace(
+                run_id, article,
+                filter_name=stage.name,
+                filter_order=stage.order,
+                decision="pass" if result.passed else "reject",
+                reasoning=result.reasoning,
+                score=score,
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                latency_ms=latency
+            ))
+            
+            if stage.score_field:
+                updates[stage.score_field] = score or 0.0
+            
+            if not result.passed:
+                # Only the news check classifies non-news; later stages saw news
+                updates['content_type'] = getattr(result, 'category', "news_article")
+                updates.setdefault('filter_score', 0.0)
+                updates['filter_notes'] = f"Rejected at {stage.name}: {result.reasoning}"
+                return False, stage.name, updates
+                
+        except Exception as e:
+            logger.error(f"{stage.name} error: {e}")
+            updates['filter_notes'] = f"Error in {stage.name}: {e}"
+            return False, f"{stage.name}_error", updates
     
     # =========================================
-    # FILTER 2: Wow Factor
+    # PASSED ALL FILTERS
     # =========================================
-    try:
-        start_ms = int(time.time() * 1000)
-        result2 = filter_wow_factor(article_data)
-        latency2 = int(time.time() * 1000) - start_ms
-        
-        record_trace(
-            session, run_id, article,
-            filter_name="wow_factor",
-            filter_order=2,
-            decision="pass" if result2.passed else "reject",
-            reasoning=result2.reasoning,
-            score=result2.score,
-            input_tokens=result2.input_tokens,
-            output_tokens=result2.output_tokens,
-            latency_ms=latency2
-        )
-        
-        article.wow_score = result2.score
+    updates['content_type'] = "news_article"
+    updates['filter_notes'] = f"Passed all filters. Wow: {updates['wow_score']:.2f}. Values: {updates['filter_score']:.2f}"
+    return True, None, updates
+
+
+async def drain_queue(session: AsyncSession, run_id: UUID, rules_prompt: str, traces: list[FilterTrace], on_result) -> int:
+    """
+    Filter unfiltered articles with up to BATCH_SIZE in flight at once.
+    
+    As soon as one article finishes, its result is handed to on_result and a
+    replacement is claimed, so a slow article never holds up the rest of a batch.
+    Returns when the queue is empty or shutdown is requested. If a claim or
+    on_result raises, unfinished articles are cancelled and released back to
+    the queue before the error propagates.
+    
+    Claims are committed on their own session, so session only ever commits
+    what the caller commits: finished articles' updates together with their
+    traces.
+    
+    Args:
+        traces: List that a finished article's filter traces are appended to,
+                just before its on_result call
+        on_result: Coroutine function taking (article, passed, rejection_stage)
         
-        if not result2.passed:
-            article.content_type = "news_article"
-            article.filter_score = 0.0
-            article.filter_notes = f"Rejected at wow_factor: {result2.reasoning}"
-            return False, "wow_factor"
+    Returns:
+        Number of articles processed
+    """
+    async def process(article: Article):
+        article_traces = []
+        outcome = await process_article_with_tracing(article, run_id, rules_prompt, article_traces)
+        return article, outcome, article_traces
+    
+    # Claimed articles whose result hasn't been handed to on_result yet
+    in_flight: dict[asyncio.Task, Article] = {}
+    processed = 0
+    
+    try:
+        while True:
+            free_slots = BATCH_SIZE - len(in_flight)
+            if free_slots > 0 and not shutdown_requested:
+                async with AsyncSessionLocal() as claim_session:
+                    claimed = await claim_articles(claim_session, free_slots)
+                # Attached with no pending changes; updates are made once an article finishes
+                session.add_all(claimed)
+                for article in claimed:
+                    logger.info(f"Processing: {article.headline[:50]}...")
+                    in_flight[asyncio.create_task(process(article))] = article
             
-    except Exception as e:
-        logger.error(f"Wow factor error: {e}")
-        article.filter_notes = f"Error in wow_factor: {e}"
-        return False, "wow_factor_error"
+            if not in_flight:
+                return processed
+            
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                article, (passed, rejection_stage, updates), article_traces = task.result()
+                for field, value in updates.items():
+                    setattr(article, field, value)
+                traces.extend(article_traces)
+                await on_result(article, passed, rejection_stage)
+                del in_flight[task]
+                processed += 1
+    finally:
+        # Only left over when something raised: stop the orphaned tasks and
+        # hand their articles back instead of stranding them in 'filtering'
+        if in_flight:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            await release_articles([article.id for article in in_flight.values()])
+
+
+async def release_articles(article_ids: list[UUID]) -> None:
+    """
+    Return claimed articles to the queue as unfiltered.
     
-    # =========================================
-    # FILTER 3: Values Fit
-    # =========================================
+    Uses its own session: the caller's may be the one that just failed.
+    """
+    async with AsyncSessionLocal() as release_session:
+        await release_session.execute(
+            update(Article)
+            .where(Article.id.in_(article_ids), Article.filter_status == FilterStatus.FILTERING)
+            .values(filter_status=FilterStatus.UNFILTERED)
+            .execution_options(synchronize_session=False)
+        )
+        await release_session.commit()
+    logger.info(f"Released {len(article_ids)} unfinished articles back to the queue")
+
+
+async def get_queue_stats(session: AsyncSession) -> dict:
+    """Get current queue statistics (one grouped COUNT instead of one per status)."""
+    stmt = select(Article.filter_status, func.count()).group_by(Article.filter_status)
+    result = await session.execute(stmt)
+    
+    stats = {status.value: 0 for status in FilterStatus}
+    for status, count in result:
+        stats[status.value] = count
+    return stats
+
+
+async def listen_for_articles(wakeup: asyncio.Event):
+    """
+    LISTEN for discovery's new-article notifications on a dedicated connection.
+
+    Args:
+        wakeup: Event set whenever a notification arrives
+
+    Returns:
+        The listening AsyncConnection (caller closes it), or None if LISTEN
+        could not be set up and the worker should fall back to polling
+    """
     try:
-        start_ms = int(time.time() * 1000)
-        result3 = filter_values_fit(article_data, rules)
-        latency3 = int(time.time() * 1000) - start_ms
-        
-        record_trace(
-            session, run_id, article,
-            filter_name="values_fit",
-            filter_order=3,
-            decision="pass" if result3.passed else "reject",
-            reasoning=result3.reasoning,
-            score=result3.score,
-            input_tokens=result3.input_tokens,
-            output_tokens=result3.output_tokens,
-            latency_ms=latency3
+        conn = await async_engine.connect()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.add_listener(
+            ARTICLES_INSERTED_CHANNEL, lambda *args: wakeup.set()
         )
-        
-        article.filter_score = result3.score or 0.0
-        
-        if not result3.passed:
-            article.content_type = "news_article"
-            article.filter_notes = f"Rejected at values_fit: {result3.reasoning}"
-            return False, "values_fit"
-            
+        return conn
     except Exception as e:
-        logger.error(f"Values fit error: {e}")
-        article.filter_notes = f"Error in values_fit: {e}"
-        return False, "values_fit_error"
-    
-    # =========================================
-    # PASSED ALL FILTERS
-    # =========================================
-    article.content_type = "news_article"
-    article.filter_notes = f"Passed all filters. Wow: {result2.score:.2f}. Values: {result3.score:.2f}"
-    return True, None
-
-
-def get_queue_stats(session: Session) -> dict:
-    """Get current queue statistics."""
-    unfiltered = session.query(Article).filter(
-        Article.filter_status == FilterStatus.UNFILTERED
-    ).count()
-    
-    filtering = session.query(Article).filter(
-        Article.filter_status == FilterStatus.FILTERING
-    ).count()
-    
-    passed = session.query(Article).filter(
-        Article.filter_status == FilterStatus.PASSED
-    ).count()
-    
-    rejected = session.query(Article).filter(
-        Article.filter_status == FilterStatus.REJECTED
-    ).count()
-    
-    return {
-        'unfiltered': unfiltered,
-        'filtering': filtering,
-        'passed': passed,
-        'rejected': rejected
-    }
+        logger.warning(f"Could not LISTEN on {ARTICLES_INSERTED_CHANNEL}, polling only: {e}")
+        return None
 
 
-def run_worker_loop():
+async def run_worker_loop():
     """Main worker loop - runs continuously until shutdown signal."""
     global current_run, current_run_id
     
@@ -315,106 +472,150 @@ def run_worker_loop():
     filter3_pass = 0
     total_processed = 0
     
-    # Load filter rules once
-    rules = load_filter_rules()
+    # Load filter rules and render the shared values fit prompt prefix once
+    rules_prompt = render_rules_prompt(load_filter_rules())
+    
+    # Finished articles and their traces waiting for the next commit, and
+    # the counters as of the last one
+    pending_traces: list[FilterTrace] = []
+    pending_article_ids: list[UUID] = []
+    committed_counts = (0, 0, 0, 0)
+    
+    async def commit_pending():
+        """Save pending traces, article updates and run counts in one transaction."""
+        nonlocal committed_counts
+        traces = list(pending_traces)
+        await session.run_sync(lambda sync_session: sync_session.bulk_save_objects(traces))
+        
+        await update_run_counts(session, current_run_id, filter1_pass, filter2_pass, filter3_pass)
+        pending_traces.clear()
+        pending_article_ids.clear()
+        committed_counts = (filter1_pass, filter2_pass, filter3_pass, total_processed)
+    
+    async def discard_pending():
+        """
+        Roll back uncommitted work and return its articles to the queue.
+        
+        Their updates and traces are dropped together, so every article
+        committed as passed or rejected keeps its traces, and the released
+        ones are simply filtered (and traced) again.
+        """
+        nonlocal filter1_pass, filter2_pass, filter3_pass, total_processed
+        await session.rollback()
+        if pending_article_ids:
+            try:
+                await release_articles(list(pending_article_ids))
+            except Exception as e:
+                logger.error(f"Could not release {len(pending_article_ids)} articles: {e}")
+        pending_traces.clear()
+        pending_article_ids.clear()
+        filter1_pass, filter2_pass, filter3_pass, total_processed = committed_counts
+    
+    async def record_result(article: Article, passed: bool, rejection_stage: str):
+        """Apply a finished article's outcome, committing every COMMIT_INTERVAL articles."""
+        nonlocal filter1_pass, filter2_pass, filter3_pass, total_processed
+        pending_article_ids.append(article.id)
+        
+        # Update pass counts based on where it stopped
+        d1, d2, d3 = STAGE_PASS_COUNTS[rejection_stage]
+        filter1_pass += d1
+        filter2_pass += d2
+        filter3_pass += d3
+        
+        # Update article status
+        if passed:
+            article.filter_status = FilterStatus.PASSED
+            article.status = ArticleStatus.PENDING
+            logger.info(f"PASSED: {article.headline[:50]} (score={article.filter_score:.2f})")
+        else:
+            article.filter_status = FilterStatus.REJECTED
+            article.status = ArticleStatus.REJECTED
+            logger.info(f"REJECTED at {rejection_stage}: {article.headline[:50]}")
+        
+        # Link article to run
+        article.last_run_id = current_run_id
+        
+        total_processed += 1
+        if total_processed % COMMIT_INTERVAL == 0:
+            await commit_pending()
     
     # Create initial session to set up run
-    session = SessionLocal()
-    try:
-        stats = get_queue_stats(session)
-        current_run = create_worker_run(session, stats['unfiltered'])
+    async with AsyncSessionLocal() as session:
+        stats = await get_queue_stats(session)
+        current_run = await create_worker_run(session, stats['unfiltered'])
         current_run_id = current_run.id
-    finally:
-        session.close()
+    
+    queue_idle = False
+    
+    # Discovery notifies as soon as it stores articles, ending the idle sleep early
+    articles_inserted = asyncio.Event()
+    listen_conn = await listen_for_articles(articles_inserted)
+    
+    # One session for the life of the loop. Each commit still hands its
+    # connection back to the pool, so nothing is held open while idle.
+    session = AsyncSessionLocal()
     
     while not shutdown_requested:
-        session = SessionLocal()
-        
         try:
+            # Clear before checking so a notification after the check is not lost
+            articles_inserted.clear()
+            
             # Check queue status
-            stats = get_queue_stats(session)
+            stats = await get_queue_stats(session)
             
             if stats['unfiltered'] == 0:
                 # Update run counts before sleeping
-                run = session.query(PipelineRun).filter(PipelineRun.id == current_run_id).first()
-                if run:
-                    update_run_counts(session, run, filter1_pass, filter2_pass, filter3_pass)
+                await update_run_counts(session, current_run_id, filter1_pass, filter2_pass, filter3_pass)
                 
-                logger.info(f"Queue empty. Sleeping {SLEEP_INTERVAL}s... (passed={filter3_pass}, rejected={total_processed - filter3_pass})")
-                session.close()
-                time.sleep(SLEEP_INTERVAL)
+                # Only announce the transition to idle; repeat polls stay at DEBUG
+                log_level = logging.DEBUG if queue_idle else logging.INFO
+                logger.log(log_level, f"Queue empty. Sleeping {SLEEP_INTERVAL}s... (passed={filter3_pass}, rejected={total_processed - filter3_pass})")
+                queue_idle = True
+                try:
+                    await asyncio.wait_for(articles_inserted.wait(), SLEEP_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
                 continue
             
-            logger.info(f"Queue: {stats['unfiltered']} unfiltered, {stats['filtering']} in progress")
+            if queue_idle:
+                logger.info(f"Queue has work: {stats['unfiltered']} unfiltered")
+                queue_idle = False
+            logger.debug(f"Queue: {stats['unfiltered']} unfiltered, {stats['filtering']} in progress")
             
-            # Process articles
-            for _ in range(BATCH_SIZE):
-                if shutdown_requested:
-                    break
-                    
-                article = claim_next_article(session)
-                
-                if article is None:
-                    break
-                
-                logger.info(f"Processing: {article.headline[:50]}...")
-                start_time = time.time()
-                
-                # Process with tracing
-                passed, rejection_stage = process_article_with_tracing(
-                    session, article, current_run_id, rules
-                )
-                
-                # Update article status
-                if passed:
-                    article.filter_status = FilterStatus.PASSED
-                    article.status = ArticleStatus.PENDING
-                    filter1_pass += 1
-                    filter2_pass += 1
-                    filter3_pass += 1
-                    logger.info(f"PASSED: {article.headline[:50]} (score={article.filter_score:.2f})")
-                else:
-                    article.filter_status = FilterStatus.REJECTED
-                    article.status = ArticleStatus.REJECTED
-                    # Update pass counts based on where it failed
-                    if rejection_stage not in ["news_check", "news_check_error"]:
-                        filter1_pass += 1
-                    if rejection_stage not in ["news_check", "news_check_error", "wow_factor", "wow_factor_error"]:
-                        filter2_pass += 1
-                    logger.info(f"REJECTED at {rejection_stage}: {article.headline[:50]}")
-                
-                # Link article to run
-                article.last_run_id = current_run_id
-                
-                session.commit()
-                total_processed += 1
-                
+            # Keep BATCH_SIZE articles in flight until the queue drains
+            start_time = time.time()
+            processed = await drain_queue(session, current_run_id, rules_prompt, pending_traces, record_result)
+            
+            if processed:
                 duration = time.time() - start_time
-                logger.info(f"Processed in {duration:.1f}s (total: {total_processed})")
+                logger.info(f"Processed {processed} articles in {duration:.1f}s (total: {total_processed})")
             
-            # Update run counts periodically (every batch)
-            run = session.query(PipelineRun).filter(PipelineRun.id == current_run_id).first()
-            if run:
-                update_run_counts(session, run, filter1_pass, filter2_pass, filter3_pass)
+            # Commit whatever is left once the queue drains
+            await commit_pending()
             
-            # Brief pause between batches
-            time.sleep(1)
+            # Brief pause before re-checking the queue
+            await asyncio.sleep(1)
             
         except Exception as e:
             logger.error(f"Worker loop error: {e}")
-            time.sleep(5)
+            # Discard uncommitted work and keep going with the same session
+            await discard_pending()
+            await asyncio.sleep(5)
             
         finally:
-            session.close()
+            # Forget finished articles so the identity map doesn't grow and
+            # the next pass loads fresh rows
+            session.expunge_all()
     
     # Finalize run on shutdown
-    session = SessionLocal()
-    try:
-        run = session.query(PipelineRun).filter(PipelineRun.id == current_run_id).first()
-        if run:
-            finalize_run(session, run, PipelineRunStatus.COMPLETED)
-    finally:
-        session.close()
+    run = await session.get(PipelineRun, current_run_id)
+    if run:
+        await finalize_run(session, run, PipelineRunStatus.COMPLETED)
+    await session.close()
+    
+    if listen_conn is not None:
+        await listen_conn.close()
+    await async_engine.dispose()
     
     logger.info("=" * 60)
     logger.info("FILTER WORKER SHUTTING DOWN")
@@ -427,13 +628,16 @@ def main():
     """Entry point for the filter worker."""
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    listener = start_log_listener()
     
     try:
-        run_worker_loop()
+        asyncio.run(run_worker_loop())
         return 0
     except Exception as e:
         logger.error(f"Worker failed: {e}", exc_info=True)
         return 1
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
@@ -4,8 +4,7 @@
 # FIRST THING: Print to prove we're running
 import sys
 import time
-print("=== PIPELINE SCRIPT STARTING ===", file=sys.stdout, flush=True)
-print("=== PIPELINE SCRIPT STARTING ===", file=sys.stderr, flush=True)
+print("=== PIPELINE SCRIPT STARTING ===", flush=True)
 
 import os
 os.environ['PYTHONUNBUFFERED'] = '1'
@@ -14,11 +13,12 @@ os.environ['PYTHONUNBUFFERED'] = '1'
 _SCRIPT_START = time.time()
 
 def log(msg):
-    """Print with immediate flush for Railway logs, including elapsed time."""
+    """Print with immediate flush for Railway logs, including elapsed time.
+
+    Railway captures stdout and stderr alike, so each message is written once.
+    """
     elapsed = time.time() - _SCRIPT_START
-    timestamp = f"[{elapsed:7.1f}s]"
-    print(f"{timestamp} {msg}", file=sys.stdout, flush=True)
-    print(f"{timestamp} {msg}", file=sys.stderr, flush=True)
+    print(f"[{elapsed:7.1f}s] {msg}", flush=True)
 
 log("Step 0: Imports starting...")
 
@@ -25,6 +25,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
+from sqlalchemy.dialects.postgresql import insert
+
 from app.database import SessionLocal
 from app.models import Source, SourceType, FilterRule, RuleType, RuleSource
 
@@ -53,22 +55,15 @@ def seed_sources():
         sources = load_json('sources.json')
         logger.info(f"Loading {len(sources)} sources from sources.json")
         
-        for source_data in sources:
-            # Check if exists
-            existing = session.query(Source).filter_by(name=source_data['name']).first()
-            if existing:
-                logger.debug(f"Source '{source_data['name']}' already exists, skipping")
-                skipped += 1
-                continue
-            
-            # Map type string to enum
-            type_map = {
-                'rss': SourceType.RSS,
-                'search_query': SourceType.SEARCH_QUERY,
-                'manual': SourceType.MANUAL,
-            }
-            
-            source = Source(
+        # Map type string to enum
+        type_map = {
+            'rss': SourceType.RSS,
+            'search_query': SourceType.SEARCH_QUERY,
+            'manual': SourceType.MANUAL,
+        }
+        
+        values = [
+            dict(
                 name=source_data['name'],
                 type=type_map.get(source_data['type'], SourceType.RSS),
                 url=source_data.get('url'),
@@ -77,9 +72,21 @@ def seed_sources():
                 trust_score=source_data.get('trust_score', 0.5),
                 notes=source_data.get('notes'),
             )
-            session.add(source)
-            created += 1
-            logger.info(f"Created source: {source_data['name']}")
+            for source_data in sources
+        ]
+        
+        if values:
+            # Existing names are skipped by the unique index, not a SELECT per row
+            stmt = (
+                insert(Source)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=['name'])
+                .returning(Source.name)
+            )
+            for name in session.execute(stmt).scalars():
+                created += 1
+                logger.info(f"Created source: {name}")
+        skipped = len(values) - created
         
         session.commit()
         logger.info(f"Sources seeding complete: {created} created, {skipped} skipped")
@@ -107,38 +114,43 @@ def seed_filter_rules():
         rules = load_json('filter_rules.json')
         logger.info(f"Loading {len(rules)} filter rules from filter_rules.json")
         
-        for rule_data in rules:
-            # Check if exists (by rule_text to avoid exact duplicates)
-            existing = session.query(FilterRule).filter_by(rule_text=rule_data['rule_text']).first()
-            if existing:
-                logger.debug(f"Rule '{rule_data['rule_text'][:50]}...' already exists, skipping")
-                skipped += 1
-                continue
-            
-            # Map type string to enum
-            type_map = {
-                'must_have': RuleType.MUST_HAVE,
-                'must_avoid': RuleType.MUST_AVOID,
-                'good_topic': RuleType.GOOD_TOPIC,
-                'borderline': RuleType.BORDERLINE,
-            }
-            
-            source_map = {
-                'original': RuleSource.ORIGINAL,
-                'learned': RuleSource.LEARNED,
-                'manual': RuleSource.MANUAL,
-            }
-            
-            rule = FilterRule(
+        # Map type string to enum
+        type_map = {
+            'must_have': RuleType.MUST_HAVE,
+            'must_avoid': RuleType.MUST_AVOID,
+            'good_topic': RuleType.GOOD_TOPIC,
+            'borderline': RuleType.BORDERLINE,
+        }
+        
+        source_map = {
+            'original': RuleSource.ORIGINAL,
+            'learned': RuleSource.LEARNED,
+            'manual': RuleSource.MANUAL,
+        }
+        
+        values = [
+            dict(
                 rule_type=type_map.get(rule_data['rule_type'], RuleType.MUST_HAVE),
                 rule_text=rule_data['rule_text'],
                 priority=rule_data.get('priority', 50),
                 is_active=rule_data.get('is_active', True),
                 source=source_map.get(rule_data.get('source', 'original'), RuleSource.ORIGINAL),
             )
-            session.add(rule)
-            created += 1
-            logger.info(f"Created rule: {rule_data['rule_text'][:60]}...")
+            for rule_data in rules
+        ]
+        
+        if values:
+            # Exact duplicates (by rule_text) are skipped by the unique index
+            stmt = (
+                insert(FilterRule)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=['rule_text'])
+                .returning(FilterRule.rule_text)
+            )
+            for rule_text in session.execute(stmt).scalars():
+                created += 1
+                logger.info(f"Created rule: {rule_text[:60]}...")
+        skipped = len(values) - created
         
         session.commit()
         logger.info(f"Filter rules seeding complete: {created} created, {skipped} skipped")
@@ -5,6 +5,7 @@ Adds project root to Python path and provides common fixtures
 """
 import sys
 import os
+from functools import partial
 
 import pytest
 from dotenv import load_dotenv
@@ -16,21 +17,117 @@ sys.path.insert(0, project_root)
 # Load environment variables
 load_dotenv()
 
+# Test runs are too short for pooled connections to go stale, so skip the
+# SELECT 1 liveness check on every checkout
+os.environ.setdefault("DB_POOL_PRE_PING", "False")
 
-@pytest.fixture(scope="function")
-def db_session():
+
+@pytest.fixture(scope="session")
+def db_connection():
     """
-    Provides a database session for tests.
+    One connection for the whole test run
     
-    Session is automatically closed after each test.
-    Tests should use transactions and rollback for isolation.
+    Opened once, so connection setup is paid a single time rather than per
+    test. Everything happens inside a single outer transaction that is rolled back
+    at the end, so nothing the tests write is ever committed for real.
+    
+    Under pytest-xdist each worker runs against its own migrated schema,
+    dropped again at the end. Uncommitted rows in a shared table would still
+    collide: a worker inserting a URL another worker holds would block on the
+    unique index until that worker's whole run finished.
+    """
+    # Deferred so unit tests can run without DATABASE_URL set
+    from sqlalchemy import text
+    from app.database import engine
+    from tests.fixtures.schema import migrate_schema
+    
+    connection = engine.connect()
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    schema = f"test_{worker}" if worker else None
+    if schema:
+        migrate_schema(connection, schema)
+    
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        if schema:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            # The connection goes back to the pool, so undo the search_path too
+            connection.execute(text("RESET search_path"))
+            connection.commit()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_factory(db_connection):
+    """
+    SessionLocal stand-in whose sessions share the test connection
+    
+    Each session turns its own transactions into SAVEPOINTs, so code that
+    commits through it never ends the outer transaction. Patch it over a
+    module's SessionLocal to run that code inside the test's rollback.
     """
     from app.database import SessionLocal
     
-    session = SessionLocal()
+    return partial(
+        SessionLocal,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        # Nothing else can write inside the test's transaction, so loaded
+        # attributes stay valid across commit() and needn't be re-selected
+        expire_on_commit=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def baseline_source_id(db_connection):
+    """
+    Id of a Source row shared by every test
+    
+    Inserted straight into the outer transaction with one Core INSERT. It
+    is requested by db_session, so it always exists before any test
+    savepoint opens and no savepoint rollback can remove it.
+    """
+    from app.models import Source, SourceType
+    
+    return db_connection.execute(
+        Source.__table__.insert().returning(Source.__table__.c.id),
+        {
+            "name": "Test Source Baseline",
+            "type": SourceType.RSS,
+            "url": "https://example.com/feed.xml",
+            "is_active": True,
+            "trust_score": 0.5,
+            "total_surfaced": 0,
+            "total_approved": 0,
+            "total_rejected": 0,
+        }
+    ).scalar_one()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection, session_factory, baseline_source_id):
+    """
+    Database session whose work is rolled back after each test
+    
+    The session turns each of its own transactions into a SAVEPOINT:
+    commit() releases it and rollback() (including after an expected
+    IntegrityError) returns to it, so tests behave as usual.
+    """
+    savepoint = db_connection.begin_nested()
+    session = session_factory()
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
+        savepoint.rollback()
+
 
+@pytest.fixture
+def test_source(db_session, baseline_source_id):
+    """The baseline test source, loaded into this test's session"""
+    from app.models import Source
+    
+    return db_session.get(Source, baseline_source_id)
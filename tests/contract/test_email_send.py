@@ -4,10 +4,14 @@ Contract tests for Email Service
 Tests that SendGrid integration works correctly with mocked responses.
 """
 
+import uuid
+
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
 
+from sqlalchemy import insert, select
+
 from app.services.email import (
     format_date_for_email,
     send_email,
@@ -16,44 +20,28 @@ from app.services.email import (
     update_articles_to_emailed,
     get_template_env,
 )
-from app.models import Article, ArticleStatus, EmailBatch, EmailStatus, Source
+from app.models import Article, ArticleStatus, EmailBatch, EmailStatus, Source, SourceType
 
 
 class TestRenderEmail:
     """Tests for email template rendering."""
     
-    def test_render_email_with_articles(self, db_session):
+    def test_render_email_with_articles(self, request):
         """Test email renders correctly with articles."""
-        from app.models import SourceType
-        
-        # Create test source
-        source = Source(
-            name="Test Source Email Render",
-            type=SourceType.RSS,
-            url="https://example.com/feed.xml",
-        )
-        db_session.add(source)
-        db_session.flush()
-        
-        import uuid
-        
-        # Create test articles
-        articles = []
-        for i in range(3):
-            article = Article(
+        # Rendering only reads attributes, so unsaved articles are enough
+        articles = [
+            Article(
+                id=uuid.uuid4(),
                 headline=f"Test Article {i}",
-                external_url=f"https://example.com/article-render-{uuid.uuid4()}",
-                source_id=source.id,
+                external_url=f"https://example.com/{request.node.name}/{i}",
                 source_name="Test Source",
                 filter_score=0.85 - (i * 0.1),
                 summary=f"Summary for article {i}",
                 amish_angle=f"Amish angle for article {i}",
                 status=ArticleStatus.PENDING,
             )
-            db_session.add(article)
-            articles.append(article)
-        
-        db_session.commit()
+            for i in range(3)
+        ]
         
         # Render email - use dynamic date
         test_date = format_date_for_email()
@@ -73,7 +61,13 @@ class TestRenderEmail:
             assert f"http://test.local/feedback/{article.id}/no" in html
             assert f"http://test.local/feedback/{article.id}/why_not" in html
     
-    def test_render_email_empty_articles(self, db_session):
+    def test_template_env_is_shared(self):
+        """Test templates are loaded through one cached environment."""
+        env = get_template_env()
+        assert get_template_env() is env
+        assert env.get_template('email/daily_candidates.html') is env.get_template('email/daily_candidates.html')
+    
+    def test_render_email_empty_articles(self):
         """Test email renders with no articles."""
         test_date = format_date_for_email()
         html = render_email_html([], test_date)
@@ -178,9 +172,8 @@ class TestEmailBatch:
             status=EmailStatus.SENT,
         )
         
-        db_session.commit()
-        
         assert batch.id is not None
+        assert batch.created_at is not None
         assert batch.recipient_emails == ['test@example.com']
         assert batch.article_count == 10
         assert batch.subject_line == 'Test Subject'
@@ -198,8 +191,6 @@ class TestEmailBatch:
             error_message='Connection timeout',
         )
         
-        db_session.commit()
-        
         assert batch.status == EmailStatus.FAILED
         assert batch.error_message == 'Connection timeout'
 
@@ -207,18 +198,14 @@ class TestEmailBatch:
 class TestUpdateArticles:
     """Tests for article status updates after email."""
     
-    def test_update_articles_to_emailed(self, db_session):
+    def test_update_articles_to_emailed(self, db_session, request):
         """Test updating article status after successful email."""
-        from app.models import SourceType
-        
         # Create test source
         source = Source(
             name="Test Source Update Email",
             type=SourceType.RSS,
             url="https://example.com/feed.xml",
         )
-        db_session.add(source)
-        db_session.flush()
         
         # Create email batch
         batch = EmailBatch(
@@ -228,38 +215,37 @@ class TestUpdateArticles:
             subject_line='Test',
             status=EmailStatus.SENT,
         )
-        db_session.add(batch)
+        db_session.add_all([source, batch])
         db_session.flush()
         
-        import uuid
-        
         # Create test articles
-        articles = []
-        for i in range(3):
-            article = Article(
-                headline=f"Test Article {i}",
-                external_url=f"https://example.com/article-update-{uuid.uuid4()}",
-                source_id=source.id,
-                source_name="Test Source",
-                summary=f"Summary for article {i}",
-                amish_angle=f"Amish angle for article {i}",
-                filter_score=0.8,
-                status=ArticleStatus.PENDING,
-            )
-            db_session.add(article)
-            articles.append(article)
-        
-        db_session.flush()
+        articles = db_session.scalars(insert(Article).returning(Article), [
+            {
+                "headline": f"Test Article {i}",
+                "external_url": f"https://example.com/{request.node.name}/{i}",
+                "source_id": source.id,
+                "source_name": "Test Source",
+                "summary": f"Summary for article {i}",
+                "amish_angle": f"Amish angle for article {i}",
+                "filter_score": 0.8,
+                "status": ArticleStatus.PENDING,
+            }
+            for i in range(3)
+        ]).all()
         
         # Update articles
         count = update_articles_to_emailed(db_session, articles, batch.id)
-        db_session.commit()
+        db_session.flush()
         
         assert count == 3
         
-        for article in articles:
-            db_session.refresh(article)
-            assert article.status == ArticleStatus.EMAILED
-            assert article.email_batch_id == batch.id
-            assert article.emailed_date is not None
+        rows = db_session.execute(
+            select(Article.status, Article.email_batch_id, Article.emailed_date)
+            .where(Article.id.in_([a.id for a in articles]))
+        ).all()
+        assert len(rows) == 3
+        for row in rows:
+            assert row.status == ArticleStatus.EMAILED
+            assert row.email_batch_id == batch.id
+            assert row.emailed_date is not None
 
@@ -4,24 +4,32 @@ Contract tests for RSS feed fetching.
 Tests RSS parsing with valid feeds, malformed feeds, and network errors.
 """
 
+import os
 import pytest
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime
 import time
 
 from app.services.rss_fetcher import fetch_rss_feed, _parse_entry
 
+SAMPLE_FEED = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'sample_feed.xml')
+
 
 def _make_time_tuple(dt: datetime = None) -> tuple:
     """Create a time tuple for feedparser from a datetime (defaults to now)."""
     if dt is None:
-        dt = datetime.now(timezone.utc)
-    return time.strptime(dt.strftime('%Y %m %d %H %M %S'), '%Y %m %d %H %M %S')
+        return time.gmtime()
+    return dt.utctimetuple()
 
 
 class TestFetchRssFeed:
     """Tests for fetch_rss_feed function."""
     
+    @pytest.mark.network
+    @pytest.mark.skipif(
+        not os.environ.get('RUN_NETWORK_TESTS'),
+        reason="RUN_NETWORK_TESTS not set - skipping live RSS fetch"
+    )
     def test_fetch_valid_rss_feed(self):
         """Test fetching a real RSS feed (integration-like contract test)."""
         # Use a reliable public RSS feed for testing
@@ -48,6 +56,21 @@ class TestFetchRssFeed:
             # Network issues are acceptable in CI/CD
             pytest.skip("Network unavailable for RSS fetch test")
     
+    def test_fetch_saved_rss_feed(self):
+        """Test fetching a saved RSS document through the real feedparser."""
+        # feedparser reads local paths the same way it reads URLs
+        articles = fetch_rss_feed(SAMPLE_FEED)
+        
+        assert [a['headline'] for a in articles] == [
+            "Goat Elected Honorary Mayor of Small Vermont Town",
+            "Farmer Grows 2,000-Pound Pumpkin",
+            "Library Book Returned 80 Years Late",
+        ]
+        for article in articles:
+            assert article['url'].startswith('https://example.com/odd-news/')
+            assert article['published_date'].year == 2025
+            assert article['content']
+    
     @patch('app.services.rss_fetcher.feedparser')
     def test_fetch_with_mocked_feedparser(self, mock_feedparser):
         """Test RSS parsing with mocked feedparser response."""
@@ -118,6 +141,7 @@ class TestFetchRssFeed:
         assert articles == []
     
     @patch('app.services.rss_fetcher.feedparser')
+    @patch('app.services.rss_fetcher.RETRY_BASE_DELAY', 0)
     def test_fetch_server_error_triggers_retry(self, mock_feedparser):
         """Test that server errors trigger retry logic."""
         # First call returns 500, subsequent calls succeed
@@ -135,13 +159,11 @@ class TestFetchRssFeed:
         
         mock_feedparser.parse.side_effect = [mock_error, mock_success]
         
-        # With retries, should eventually succeed
-        # Note: This test may be slow due to retry delays
+        # With retries, should eventually succeed (backoff patched to zero)
         articles = fetch_rss_feed('https://example.com/flaky.xml')
         
-        # May or may not succeed depending on retry timing
-        # The important thing is it doesn't crash
         assert isinstance(articles, list)
+        assert mock_feedparser.parse.call_count == 2
 
 
 class TestParseEntry:
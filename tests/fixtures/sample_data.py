@@ -3,14 +3,19 @@ Test data factories for creating sample database records
 
 Provides factory functions for all entities with sensible defaults
 """
+import csv
+import io
+import secrets
 from datetime import datetime, timezone, date
-from uuid import uuid4
 
 from app.models import (
     Article, Source, Feedback, FilterRule, EmailBatch, DeepDive, RefinementLog,
     ArticleStatus, SourceType, FeedbackRating, RuleType, RuleSource, EmailStatus
 )
 
+DEFAULT_KEY_POINTS = ("Key point 1", "Key point 2", "Key point 3")
+DEFAULT_RECIPIENTS = ("test@example.com",)
+
 
 def create_article(
     external_url=None,
@@ -35,7 +40,7 @@ def create_article(
         Article instance (not committed to database)
     """
     if external_url is None:
-        external_url = f"https://example.com/article/{uuid4()}"
+        external_url = f"https://example.com/article/{secrets.token_hex(8)}"
     
     if source_id is None:
         raise ValueError("source_id is required for Article")
@@ -53,6 +58,52 @@ def create_article(
     )
 
 
+def copy_articles(session, source_id, rows):
+    """
+    Load many articles with one COPY FROM STDIN, for seeding at scale
+    
+    Only the columns listed below can be overridden; everything else
+    takes its server default.
+    
+    Args:
+        session: Database session on the psycopg2 driver (caller commits)
+        source_id: Foreign key to Source for every row
+        rows: One dict of field overrides per article to insert
+    """
+    columns = [
+        "external_url", "headline", "source_name", "source_id",
+        "summary", "amish_angle", "filter_score", "status",
+    ]
+    defaults = {
+        "headline": "Test Article Headline",
+        "source_name": "Test Source",
+        "source_id": source_id,
+        "summary": "This is a test article summary with some interesting content.",
+        "amish_angle": "This article relates to Amish values because of community and simplicity.",
+        "filter_score": 0.75,
+        "status": ArticleStatus.PENDING.name,
+    }
+    
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for overrides in rows:
+        values = {
+            **defaults,
+            "external_url": f"https://example.com/article/{secrets.token_hex(8)}",
+            **overrides
+        }
+        writer.writerow([values[column] for column in columns])
+    buf.seek(0)
+    
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY articles ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+        )
+    finally:
+        cursor.close()
+
+
 def create_source(
     name=None,
     type=SourceType.RSS,
@@ -73,7 +124,7 @@ def create_source(
         Source instance (not committed to database)
     """
     if name is None:
-        name = f"Test Source {uuid4()}"
+        name = f"Test Source {secrets.token_hex(8)}"
     
     return Source(
         name=name,
@@ -172,7 +223,7 @@ def create_email_batch(
         sent_at = datetime.now(timezone.utc)
     
     if recipient_emails is None:
-        recipient_emails = ["test@example.com"]
+        recipient_emails = list(DEFAULT_RECIPIENTS)
     
     return EmailBatch(
         sent_at=sent_at,
@@ -211,8 +262,10 @@ def create_deep_dive(
         raise ValueError("article_id is required for DeepDive")
     
     if key_points is None:
-        key_points = ["Key point 1", "Key point 2", "Key point 3"]
+        key_points = list(DEFAULT_KEY_POINTS)
     
+    # JSONB defaults are built fresh each call: the instance owns (and may
+    # mutate) its dict, and a read-only mapping wouldn't serialize to JSON
     if additional_sources is None:
         additional_sources = {
             "sources": [
@@ -225,7 +278,7 @@ def create_deep_dive(
         }
     
     if google_doc_id is None:
-        google_doc_id = f"doc_{uuid4().hex[:12]}"
+        google_doc_id = f"doc_{secrets.token_hex(6)}"
     
     if google_doc_url is None:
         google_doc_url = f"https://docs.google.com/document/d/{google_doc_id}"
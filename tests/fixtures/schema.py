@@ -0,0 +1,27 @@
+"""
+Migrated Postgres schemas for tests that need a database of their own
+
+Used for per-xdist-worker schemas and by tests whose commits must never
+reach the shared tables.
+"""
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(PROJECT_ROOT, "alembic.ini")
+
+
+def migrate_schema(connection, schema):
+    """Recreate schema, point the connection at it and run the migrations there"""
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {schema}"))
+    connection.execute(text(f"SET search_path TO {schema}"))
+    connection.commit()
+    
+    alembic_cfg = Config(ALEMBIC_INI)
+    alembic_cfg.attributes["connection"] = connection
+    command.upgrade(alembic_cfg, "head")
+    connection.commit()
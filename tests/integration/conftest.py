@@ -5,8 +5,13 @@ Provides performance measurement fixtures and session management
 """
 import pytest
 import time
+from unittest.mock import patch
+
 from dotenv import load_dotenv
-from sqlalchemy import text
+from sqlalchemy import inspect
+
+from app import create_app
+from app.database import engine
 
 # Load environment variables for tests
 load_dotenv()
@@ -30,45 +35,75 @@ def performance_timer():
             self.elapsed = None
         
         def __enter__(self):
-            self.start = time.time()
+            self.start = time.perf_counter_ns()
             return self
         
         def __exit__(self, *args):
-            self.end = time.time()
-            self.elapsed = self.end - self.start
+            self.end = time.perf_counter_ns()
+            self.elapsed = (self.end - self.start) / 1e9
     
     return Timer()
 
 
-@pytest.fixture(scope="function", autouse=True)
-def cleanup_test_data(request):
+@pytest.fixture(scope="session")
+def schema_indexes():
     """
-    Auto-cleanup test data after each test
+    Every table's indexes as {table: {index_name: index_info}}
     
-    Deletes test data created during tests to prevent
-    duplicate key violations on subsequent runs
+    Reflected once, with one catalog query for all tables.
     """
-    yield
+    return {
+        table: {index['name']: index for index in indexes}
+        for (_, table), indexes in inspect(engine).get_multi_indexes().items()
+    }
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Flask app, built once for the whole run
     
-    # Cleanup after test completes
-    from app.database import SessionLocal
-    session = SessionLocal()
-    try:
-        # Delete feedback records first (foreign key to articles)
-        session.execute(text("DELETE FROM feedback WHERE article_id IN (SELECT id FROM articles WHERE external_url LIKE 'https://example.com/%')"))
-        
-        # Delete test articles (cascades to feedback and deep_dives)
-        session.execute(text("DELETE FROM articles WHERE external_url LIKE 'https://example.com/%'"))
-        
-        # Delete test sources
-        session.execute(text("DELETE FROM sources WHERE name LIKE 'Test Source%'"))
-        
-        # Delete test email batches
-        session.execute(text("DELETE FROM email_batches WHERE subject_line LIKE 'Test%' OR subject_line = 'Plain News Candidates'"))
-        
-        session.commit()
-    except Exception:
-        session.rollback()
-    finally:
-        session.close()
+    Templates are compiled up front and never re-checked on disk, so no
+    test's request pays for Jinja compilation.
+    """
+    app = create_app({'TESTING': True, 'TEMPLATES_AUTO_RELOAD': False})
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    return app
 
+
+@pytest.fixture(scope="module")
+def app_ctx(app):
+    """
+    One app context per test module
+    
+    Requests reuse an app context that is already pushed, so the client's
+    requests skip pushing and popping their own.
+    """
+    with app.app_context():
+        yield
+
+
+@pytest.fixture(scope="module")
+def module_client(app, app_ctx, session_factory):
+    """
+    Test client shared by every test in a module
+    
+    The routes' sessions share the test connection, so their commits stay
+    inside the running test's rollback and db_session sees them straight away.
+    """
+    with patch('app.routes.SessionLocal', session_factory), app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def client(module_client, db_session):
+    """
+    The module's test client, reset for one test
+    
+    Depends on db_session so the test's savepoint is open before any request,
+    and clears the cookie session so flashed messages don't carry over.
+    """
+    with module_client.session_transaction() as session:
+        session.clear()
+    return module_client
@@ -8,99 +8,124 @@ Tests verify:
 """
 import pytest
 from datetime import datetime, timezone
-from uuid import uuid4
+import itertools
+import os
 import time
 
-from app.models import Article, Source, EmailBatch, ArticleStatus, SourceType, EmailStatus
-from app.database import SessionLocal
+from sqlalchemy import func, insert, select, text
 
+from app.models import Article, EmailBatch, ArticleStatus, EmailStatus
+from tests.fixtures.sample_data import copy_articles
 
-@pytest.fixture
-def db_session():
-    """Create a database session for testing"""
-    session = SessionLocal()
-    try:
-        yield session
-        session.rollback()
-    finally:
-        session.close()
+# Unique URL suffixes; every test's rows are rolled back, so they only need
+# to be unique within one run
+_seq = itertools.count()
 
+# Column values shared by every article these tests create
+ARTICLE_FIELDS = {
+    "source_name": "Test Source",
+    "summary": "Test summary",
+    "amish_angle": "Test angle",
+    "filter_score": 0.8,
+}
 
-@pytest.fixture
-def test_source(db_session):
-    """Create a test source"""
-    source = Source(
-        name=f"Test Source {uuid4()}",
-        type=SourceType.RSS,
-        url="https://example.com/feed.xml",
-        is_active=True,
-        trust_score=0.5,
-        total_surfaced=0,
-        total_approved=0,
-        total_rejected=0
-    )
-    db_session.add(source)
-    db_session.commit()
-    db_session.refresh(source)
-    return source
+FILTER_STATUSES = (
+    ArticleStatus.PENDING,
+    ArticleStatus.EMAILED,
+    ArticleStatus.GOOD,
+    ArticleStatus.REJECTED,
+    ArticleStatus.PASSED,
+)
 
 
 class TestDailyEmailCandidateQuery:
     """Test daily email candidate query performance"""
     
-    def test_query_top_50_articles_performance(self, db_session, test_source):
+    @pytest.mark.parametrize("n", [
+        100,
+        pytest.param(50_000, marks=[
+            pytest.mark.perf,
+            pytest.mark.skipif(
+                not os.environ.get('RUN_PERF_TESTS'),
+                reason="RUN_PERF_TESTS not set - skipping full-scale seed"
+            ),
+        ]),
+    ])
+    def test_query_top_50_articles_performance(self, db_session, test_source, n):
         """
         T027 [P] [US1]: Test daily email candidate query performance
         
-        Given: 100 pending articles in database
+        Given: n pending articles in database
         When: Querying for top 50 by filter_score DESC
         Then: Query completes in under 1 second with correct results
         """
-        # Create 100 articles with varying filter scores
-        articles = []
-        for i in range(100):
-            article = Article(
-                external_url=f"https://example.com/article/query-test-{i}",
-                headline=f"Test Article {i}",
-                source_name="Test Source",
-                source_id=test_source.id,
-                summary="Test summary",
-                amish_angle="Test angle",
-                filter_score=i / 100.0,  # Scores from 0.00 to 0.99
-                status=ArticleStatus.PENDING
-            )
-            articles.append(article)
-        
-        db_session.bulk_save_objects(articles)
+        # Create n articles with varying filter scores, in one COPY
+        copy_articles(db_session, test_source.id, (
+            {
+                "external_url": f"https://example.com/article/query-test-{i}",
+                "headline": f"Test Article {i}",
+                "summary": "Test summary",
+                "amish_angle": "Test angle",
+                "filter_score": i / n,  # Scores from 0.00 up to just under 1
+            }
+            for i in range(n)
+        ))
         db_session.commit()
         
-        # Query for top 50 with timing
-        start_time = time.time()
-        
-        results = db_session.query(Article).filter(
+        # Plain column rows: no ORM objects to build on the timed path
+        stmt = select(
+            Article.id,
+            Article.filter_score,
+            Article.external_url,
+            Article.headline,
+            Article.summary,
+            Article.amish_angle,
+            Article.source_id,
+            Article.created_at,
+        ).where(
             Article.status == ArticleStatus.PENDING
         ).order_by(
             Article.filter_score.desc(),
             Article.discovered_date.desc()
-        ).limit(50).all()
+        ).limit(50)
         
-        elapsed_time = time.time() - start_time
+        # Query for top 50 with timing
+        start_time = time.perf_counter_ns()
+        
+        results = db_session.execute(stmt).all()
+        
+        elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
         
         # Verify performance
         assert elapsed_time < 1.0, f"Query took {elapsed_time:.3f}s (target: <1.0s)"
         
+        # Verify the plan is a top-k index walk. With seq scans and sorts
+        # priced out the planner still picks a Sort unless an index matches
+        # the ORDER BY, so this holds whatever the table statistics say.
+        # SET LOCAL is undone when the test's savepoint rolls back.
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        db_session.execute(text("SET LOCAL enable_sort = off"))
+        compiled = stmt.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+        plan = db_session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar_one()[0]['Plan']
+        
+        assert plan['Node Type'] == 'Limit'
+        scan = plan['Plans'][0]
+        assert scan['Node Type'] == 'Index Scan'
+        assert scan['Scan Direction'] == 'Backward'
+        assert scan['Index Name'] == 'ix_articles_daily_email'
+        
         # Verify correct results (top 50 by score)
         assert len(results) == 50
         assert results[0].filter_score >= results[49].filter_score
         
         # Verify all required fields populated
-        for article in results[:5]:  # Check first 5
-            assert article.external_url is not None
-            assert article.headline is not None
-            assert article.summary is not None
-            assert article.amish_angle is not None
-            assert article.source_id is not None
-            assert article.created_at is not None
+        for row in results[:5]:  # Check first 5
+            assert row.external_url is not None
+            assert row.headline is not None
+            assert row.summary is not None
+            assert row.amish_angle is not None
+            assert row.source_id is not None
+            assert row.created_at is not None
 
 
 class TestArticleStatusTransitions:
@@ -116,17 +141,12 @@ class TestArticleStatusTransitions:
         """
         # Create pending article
         article = Article(
-            external_url=f"https://example.com/article/transition-{uuid4()}",
+            external_url=f"https://example.com/article/transition-{next(_seq)}",
             headline="Test Headline",
-            source_name="Test Source",
             source_id=test_source.id,
-            summary="Test summary",
-            amish_angle="Test angle",
-            filter_score=0.8,
+            **ARTICLE_FIELDS,
             status=ArticleStatus.PENDING
         )
-        db_session.add(article)
-        db_session.commit()
         
         # Create email batch
         email_batch = EmailBatch(
@@ -136,8 +156,8 @@ class TestArticleStatusTransitions:
             subject_line="Test Subject",
             status=EmailStatus.SENT
         )
-        db_session.add(email_batch)
-        db_session.commit()
+        db_session.add_all([article, email_batch])
+        db_session.flush()
         
         # Update article status to emailed
         article.status = ArticleStatus.EMAILED
@@ -145,61 +165,34 @@ class TestArticleStatusTransitions:
         article.emailed_date = datetime.now(timezone.utc)
         db_session.commit()
         
-        # Verify transition
-        db_session.refresh(article)
+        # Verify transition, reloading only the columns it touched
+        db_session.expire(article, ['status', 'email_batch_id', 'emailed_date'])
         assert article.status == ArticleStatus.EMAILED
         assert article.email_batch_id == email_batch.id
         assert article.emailed_date is not None
     
-    def test_emailed_to_good_transition(self, db_session, test_source):
-        """Test emailed → good status transition"""
-        # Create emailed article
-        article = Article(
-            external_url=f"https://example.com/article/good-{uuid4()}",
-            headline="Test Headline",
-            source_name="Test Source",
-            source_id=test_source.id,
-            summary="Test summary",
-            amish_angle="Test angle",
-            filter_score=0.8,
-            status=ArticleStatus.EMAILED,
-            emailed_date=datetime.now(timezone.utc)
-        )
-        db_session.add(article)
-        db_session.commit()
-        
-        # Transition to good
-        article.status = ArticleStatus.GOOD
-        db_session.commit()
-        
-        # Verify transition
-        db_session.refresh(article)
-        assert article.status == ArticleStatus.GOOD
-    
-    def test_emailed_to_rejected_transition(self, db_session, test_source):
-        """Test emailed → rejected status transition"""
+    @pytest.mark.parametrize("to_status", [ArticleStatus.GOOD, ArticleStatus.REJECTED])
+    def test_emailed_to_feedback_transition(self, db_session, test_source, to_status):
+        """Test emailed → good / rejected status transitions"""
         # Create emailed article
         article = Article(
-            external_url=f"https://example.com/article/rejected-{uuid4()}",
+            external_url=f"https://example.com/article/{to_status.value}-{next(_seq)}",
             headline="Test Headline",
-            source_name="Test Source",
             source_id=test_source.id,
-            summary="Test summary",
-            amish_angle="Test angle",
-            filter_score=0.8,
+            **ARTICLE_FIELDS,
             status=ArticleStatus.EMAILED,
             emailed_date=datetime.now(timezone.utc)
         )
         db_session.add(article)
-        db_session.commit()
+        db_session.flush()
         
-        # Transition to rejected
-        article.status = ArticleStatus.REJECTED
+        # Transition on feedback
+        article.status = to_status
         db_session.commit()
         
         # Verify transition
-        db_session.refresh(article)
-        assert article.status == ArticleStatus.REJECTED
+        db_session.expire(article, ['status'])
+        assert article.status == to_status
 
 
 class TestArticleStatusFiltering:
@@ -214,48 +207,35 @@ class TestArticleStatusFiltering:
         Then: Only articles with that status returned
         """
         # Create articles with different statuses
-        statuses = [
-            ArticleStatus.PENDING,
-            ArticleStatus.EMAILED,
-            ArticleStatus.GOOD,
-            ArticleStatus.REJECTED,
-            ArticleStatus.PASSED
-        ]
-        
-        for idx, status in enumerate(statuses):
-            # Create 3 articles per status
-            for j in range(3):
-                article = Article(
-                    external_url=f"https://example.com/article/filter-{idx}-{j}",
-                    headline=f"Article {status.value} {j}",
-                    source_name="Test Source",
-                    source_id=test_source.id,
-                    summary="Test summary",
-                    amish_angle="Test angle",
-                    filter_score=0.8,
-                    status=status
-                )
-                db_session.add(article)
-        
-        db_session.commit()
-        
-        # Test filtering for each status
-        for status in statuses:
-            results = db_session.query(Article).filter(
-                Article.status == status
-            ).all()
-            
-            # Verify all results have correct status
-            assert len(results) >= 3  # At least our 3 test articles
-            for article in results:
-                assert article.status == status
+        # Create 3 articles per status in one executemany INSERT
+        db_session.execute(insert(Article), [
+            {
+                "external_url": f"https://example.com/article/filter-{idx}-{j}",
+                "headline": f"Article {status.value} {j}",
+                "source_id": test_source.id,
+                "status": status,
+                **ARTICLE_FIELDS,
+            }
+            for idx, status in enumerate(FILTER_STATUSES)
+            for j in range(3)
+        ])
+        
+        # Count our articles for every status in one grouped query
+        test_urls = Article.external_url.like('https://example.com/article/filter-%')
+        counts = dict(db_session.execute(
+            select(Article.status, func.count())
+            .where(test_urls)
+            .group_by(Article.status)
+        ).all())
+        
+        assert counts == {status: 3 for status in FILTER_STATUSES}
         
         # Test filtering for PENDING specifically (most common query)
-        pending_articles = db_session.query(Article).filter(
-            Article.status == ArticleStatus.PENDING
+        pending_statuses = db_session.scalars(
+            select(Article.status).where(
+                test_urls,
+                Article.status == ArticleStatus.PENDING
+            )
         ).all()
         
-        assert len(pending_articles) >= 3
-        for article in pending_articles:
-            assert article.status == ArticleStatus.PENDING
-
+        assert pending_statuses == [ArticleStatus.PENDING] * 3
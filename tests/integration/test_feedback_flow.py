@@ -4,39 +4,40 @@ Integration tests for Feedback Flow
 Tests the complete flow from email click to feedback recording.
 """
 
+import itertools
+
 import pytest
-from datetime import datetime, timezone
 
-from app import create_app
-from app.database import SessionLocal
+from sqlalchemy import func, select
+
 from app.models import Article, ArticleStatus, Feedback, FeedbackRating, Source
 
+# Unique URL suffixes; every test's rows are rolled back, so they only need
+# to be unique within one run
+_seq = itertools.count()
+
+
+def feedback_for(session, article_id):
+    """Rating and notes of the article's feedback row, or None"""
+    return session.execute(
+        select(Feedback.rating, Feedback.notes)
+        .where(Feedback.article_id == article_id)
+        .limit(1)
+    ).first()
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app({'TESTING': True})
-    with app.test_client() as client:
-        yield client
+
+def source_metric(session, column, source_id):
+    """Current value of one Source counter column"""
+    return session.execute(select(column).where(Source.id == source_id)).scalar_one()
 
 
 @pytest.fixture
-def test_article(db_session):
+def test_article(db_session, test_source):
     """Create a test article for feedback tests."""
-    from app.models import SourceType
-    
-    source = Source(
-        name=f"Test Source Feedback {datetime.now().timestamp()}",
-        type=SourceType.RSS,
-        url="https://example.com/feed.xml",
-    )
-    db_session.add(source)
-    db_session.flush()
-    
     article = Article(
         headline="Test Article for Feedback",
-        external_url=f"https://example.com/feedback-test-{datetime.now().timestamp()}",
-        source_id=source.id,
+        external_url=f"https://example.com/feedback-test-{next(_seq)}",
+        source_id=test_source.id,
         source_name="Test Source",
         summary="This is a test summary",
         amish_angle="Relevant to plain community values",
@@ -73,15 +74,13 @@ class TestGoodFeedback:
         assert b"Marked as Good" in response.data
         
         # Verify feedback was recorded
-        feedback = db_session.query(Feedback).filter(
-            Feedback.article_id == test_article.id
-        ).first()
+        feedback = feedback_for(db_session, test_article.id)
         
         assert feedback is not None
         assert feedback.rating == FeedbackRating.GOOD
         
         # Verify article status updated
-        db_session.refresh(test_article)
+        db_session.expire(test_article, ['status'])
         assert test_article.status == ArticleStatus.GOOD
     
     def test_good_feedback_duplicate(self, client, test_article, db_session):
@@ -96,9 +95,10 @@ class TestGoodFeedback:
         assert b"already recorded" in response.data.lower()
         
         # Should only have one feedback record
-        count = db_session.query(Feedback).filter(
-            Feedback.article_id == test_article.id
-        ).count()
+        count = db_session.execute(
+            select(func.count()).select_from(Feedback)
+            .where(Feedback.article_id == test_article.id)
+        ).scalar_one()
         
         assert count == 1
 
@@ -114,15 +114,13 @@ class TestNoFeedback:
         assert b"Marked as No" in response.data
         
         # Verify feedback was recorded
-        feedback = db_session.query(Feedback).filter(
-            Feedback.article_id == test_article.id
-        ).first()
+        feedback = feedback_for(db_session, test_article.id)
         
         assert feedback is not None
         assert feedback.rating == FeedbackRating.NO
         
         # Verify article status updated
-        db_session.refresh(test_article)
+        db_session.expire(test_article, ['status'])
         assert test_article.status == ArticleStatus.REJECTED
 
 
@@ -134,8 +132,9 @@ class TestWhyNotFeedback:
         response = client.get(f'/feedback/{test_article.id}/why_not')
         
         assert response.status_code == 200
-        assert b"Why doesn" in response.data
-        assert test_article.headline.encode() in response.data
+        body = response.get_data()
+        assert b"Why doesn" in body
+        assert test_article.headline.encode() in body
     
     def test_why_not_submit_with_notes(self, client, test_article, db_session):
         """Test Why Not POST with notes records feedback."""
@@ -148,16 +147,14 @@ class TestWhyNotFeedback:
         assert b"Thanks for the feedback" in response.data
         
         # Verify feedback was recorded
-        feedback = db_session.query(Feedback).filter(
-            Feedback.article_id == test_article.id
-        ).first()
+        feedback = feedback_for(db_session, test_article.id)
         
         assert feedback is not None
         assert feedback.rating == FeedbackRating.WHY_NOT
         assert feedback.notes == 'Too focused on individual achievement'
         
         # Verify article status updated
-        db_session.refresh(test_article)
+        db_session.expire(test_article, ['status'])
         assert test_article.status == ArticleStatus.REJECTED
     
     def test_why_not_submit_without_notes(self, client, test_article, db_session):
@@ -170,9 +167,7 @@ class TestWhyNotFeedback:
         assert response.status_code == 200
         
         # Verify feedback was recorded with null notes
-        feedback = db_session.query(Feedback).filter(
-            Feedback.article_id == test_article.id
-        ).first()
+        feedback = feedback_for(db_session, test_article.id)
         
         assert feedback is not None
         assert feedback.notes is None
@@ -199,26 +194,22 @@ class TestSourceMetrics:
     def test_good_feedback_increments_approved(self, client, test_article, db_session):
         """Test Good feedback increments source approved count."""
         # Get initial source metrics
-        source = db_session.query(Source).filter(Source.id == test_article.source_id).first()
-        initial_approved = source.total_approved
+        initial_approved = source_metric(db_session, Source.total_approved, test_article.source_id)
         
         # Click Good
         client.get(f'/feedback/{test_article.id}/good')
         
         # Verify source metrics updated
-        db_session.refresh(source)
-        assert source.total_approved == initial_approved + 1
+        assert source_metric(db_session, Source.total_approved, test_article.source_id) == initial_approved + 1
     
     def test_no_feedback_increments_rejected(self, client, test_article, db_session):
         """Test No feedback increments source rejected count."""
         # Get initial source metrics
-        source = db_session.query(Source).filter(Source.id == test_article.source_id).first()
-        initial_rejected = source.total_rejected
+        initial_rejected = source_metric(db_session, Source.total_rejected, test_article.source_id)
         
         # Click No
         client.get(f'/feedback/{test_article.id}/no')
         
         # Verify source metrics updated
-        db_session.refresh(source)
-        assert source.total_rejected == initial_rejected + 1
+        assert source_metric(db_session, Source.total_rejected, test_article.source_id) == initial_rejected + 1
 
@@ -0,0 +1,458 @@
+"""
+Integration tests for the background filter worker.
+
+Tests verify:
+- A batch of unfiltered articles is claimed in one statement
+- Articles stop at the first rejecting filter stage
+- Claimed articles are filtered concurrently with traces recorded
+- Duplicate content reuses cached filter results instead of calling Claude
+- Discovery's new-article notification wakes an idle worker
+
+The worker commits its claims, so these tests run against a schema of their
+own: pointed at the real queue they would claim (and strand) real articles.
+"""
+import asyncio
+import os
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.database import ARTICLES_INSERTED_CHANNEL, engine
+from app.models import Article, FilterStatus, PipelineRun, PipelineRunStatus
+from app.services.filter_news_check import NewsCheckResult
+from app.services.filter_values_fit import ValuesFitResult
+from app.services.filter_wow_factor import WowFactorResult
+from scripts import filter_worker
+from tests.fixtures.sample_data import create_article, create_source
+from tests.fixtures.schema import migrate_schema
+
+RULES_PROMPT = "MUST AVOID: test rules"
+
+# Tables the worker tests write to, emptied after every test
+WORKER_TABLES = "articles, sources, pipeline_runs, filter_traces, filter_cache"
+
+
+def run_with_worker_session(coro_fn):
+    """Run coro_fn(session) on a fresh event loop with a worker AsyncSession"""
+    async def runner():
+        try:
+            async with filter_worker.AsyncSessionLocal() as session:
+                return await coro_fn(session)
+        finally:
+            # Pooled asyncpg connections are bound to the event loop that opened them
+            await filter_worker.async_engine.dispose()
+
+    return asyncio.run(runner())
+
+
+def patch_filters(news_check, wow_factor, values_fit):
+    """Swap the Claude-backed filter functions in FILTER_PIPELINE for stubs"""
+    stubs = {"news_check": news_check, "wow_factor": wow_factor, "values_fit": values_fit}
+    pipeline = [replace(stage, filter_fn=stubs[stage.name]) for stage in filter_worker.FILTER_PIPELINE]
+    return patch.object(filter_worker, 'FILTER_PIPELINE', pipeline)
+
+
+@pytest.fixture(scope="module")
+def queue_schema():
+    """
+    A freshly migrated schema that only this module's tests write to
+    
+    Dropped again once the module finishes. Named per xdist worker so
+    parallel runs never share a queue.
+    """
+    schema = f"filter_worker_test_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+    with engine.connect() as connection:
+        migrate_schema(connection, schema)
+        # The connection goes back to the pool, so undo the search_path
+        connection.execute(text("RESET search_path"))
+        connection.commit()
+    
+    yield schema
+    
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        connection.commit()
+
+
+@pytest.fixture(scope="module")
+def queue_engine(queue_schema):
+    """Sync engine whose connections resolve tables in queue_schema"""
+    queue_engine = create_engine(engine.url, connect_args={"options": f"-csearch_path={queue_schema}"})
+    yield queue_engine
+    queue_engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def worker_engine(queue_schema):
+    """Point the worker's async engine and session factory at queue_schema"""
+    async_engine = create_async_engine(
+        filter_worker.async_engine.url,
+        connect_args={"server_settings": {"search_path": queue_schema}},
+    )
+    with patch.object(filter_worker, 'async_engine', async_engine), \
+         patch.object(filter_worker, 'AsyncSessionLocal', async_sessionmaker(async_engine, expire_on_commit=False)):
+        yield
+
+
+@pytest.fixture
+def committed_session(queue_engine):
+    """
+    Session whose commits are real, but land in queue_schema
+    
+    Visible to the worker's asyncpg connections and to a LISTEN on another
+    connection. Every table the tests write to is emptied afterwards.
+    """
+    session = Session(queue_engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        with queue_engine.begin() as connection:
+            connection.execute(text(f"TRUNCATE {WORKER_TABLES} CASCADE"))
+
+
+@pytest.fixture
+def unfiltered_articles(committed_session):
+    """Create a test source with five unfiltered articles"""
+    source = create_source()
+    committed_session.add(source)
+    committed_session.commit()
+
+    articles = [
+        create_article(
+            external_url=f"https://example.com/worker-test/{uuid4()}",
+            headline=f"Worker Test Article {i}",
+            source_id=source.id,
+            raw_content="Volunteers gathered yesterday to raise a barn. " * 5,
+            filter_status=FilterStatus.UNFILTERED,
+        )
+        for i in range(5)
+    ]
+    committed_session.add_all(articles)
+    committed_session.commit()
+    return articles
+
+
+@pytest.fixture
+def worker_run(committed_session):
+    """Create a PipelineRun to attach traces to"""
+    run = PipelineRun(status=PipelineRunStatus.RUNNING, input_count=0)
+    committed_session.add(run)
+    committed_session.commit()
+    return run
+
+
+class TestClaimArticles:
+    """Tests for claim_articles"""
+
+    def test_claims_up_to_n_articles(self, committed_session, unfiltered_articles):
+        """Should claim at most n articles and mark them as filtering"""
+        claimed = run_with_worker_session(lambda session: filter_worker.claim_articles(session, 3))
+
+        assert len(claimed) == 3
+        assert all(a.filter_status == FilterStatus.FILTERING for a in claimed)
+
+    def test_claims_oldest_articles_first(self, committed_session, unfiltered_articles):
+        """Should claim articles in the order they were created"""
+        oldest = unfiltered_articles[0]
+        committed_session.query(Article).filter(Article.id == oldest.id).update(
+            {Article.created_at: datetime(2000, 1, 1, tzinfo=timezone.utc)}
+        )
+        committed_session.commit()
+
+        claimed = run_with_worker_session(lambda session: filter_worker.claim_articles(session, 1))
+
+        assert [a.id for a in claimed] == [oldest.id]
+
+    def test_returns_empty_list_when_queue_empty(self, committed_session, unfiltered_articles):
+        """Should return an empty list once nothing is left to claim"""
+        async def claim_twice(session):
+            await filter_worker.claim_articles(session, 100)
+            return await filter_worker.claim_articles(session, 3)
+
+        assert run_with_worker_session(claim_twice) == []
+
+    def test_claim_order_is_indexed(self, schema_indexes):
+        """The claim's ORDER BY created_at should have a partial index over unfiltered rows"""
+        index = schema_indexes['articles']['ix_articles_filter_queue']
+
+        assert index['column_names'] == ['created_at']
+        assert "'unfiltered'" in index['dialect_options']['postgresql_where']
+
+
+class TestGetQueueStats:
+    """Tests for get_queue_stats"""
+
+    def test_counts_every_filter_status(self, committed_session, unfiltered_articles):
+        """Should report a count for every status, including claimed articles"""
+        async def claim_and_count(session):
+            before = await filter_worker.get_queue_stats(session)
+            await filter_worker.claim_articles(session, 2)
+            return before, await filter_worker.get_queue_stats(session)
+
+        before, after = run_with_worker_session(claim_and_count)
+
+        assert set(after) == {status.value for status in FilterStatus}
+        assert (before['unfiltered'], before['filtering']) == (5, 0)
+        assert (after['unfiltered'], after['filtering']) == (3, 2)
+
+
+class TestListenForArticles:
+    """Tests for listen_for_articles"""
+
+    def test_notification_sets_wakeup_event(self, committed_session):
+        """A NOTIFY on the articles channel should wake the worker"""
+        async def wait_for_notify(session):
+            wakeup = asyncio.Event()
+            conn = await filter_worker.listen_for_articles(wakeup)
+            try:
+                committed_session.execute(select(func.pg_notify(ARTICLES_INSERTED_CHANNEL, "1")))
+                committed_session.commit()
+                await asyncio.wait_for(wakeup.wait(), 5)
+                return wakeup.is_set()
+            finally:
+                await conn.close()
+
+        assert run_with_worker_session(wait_for_notify)
+
+
+class TestProcessArticle:
+    """Tests for process_article_with_tracing"""
+
+    @staticmethod
+    def news_check(article):
+        return NewsCheckResult(passed=True, category="news_article", reasoning="news")
+
+    def test_rejection_stops_pipeline(self, unfiltered_articles, worker_run):
+        """A rejection should skip later stages and record where it stopped"""
+        def wow_factor(article):
+            return WowFactorResult(passed=False, score=0.2, reasoning="meh")
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            raise AssertionError("values_fit should not run")
+
+        traces = []
+        with patch_filters(self.news_check, wow_factor, values_fit):
+            passed, stage, updates = run_with_worker_session(
+                lambda session: filter_worker.process_article_with_tracing(
+                    unfiltered_articles[0], worker_run.id, RULES_PROMPT, traces
+                )
+            )
+
+        assert (passed, stage) == (False, "wow_factor")
+        assert updates['wow_score'] == 0.2
+        assert updates['filter_score'] == 0.0
+        assert updates['content_type'] == "news_article"
+        assert [t.filter_name for t in traces] == ["news_check", "wow_factor"]
+
+    def test_filter_error_reports_error_stage(self, unfiltered_articles, worker_run):
+        """An exception in a filter should reject the article at <stage>_error"""
+        def wow_factor(article):
+            return WowFactorResult(passed=True, score=0.8, reasoning="wow")
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            raise RuntimeError("API down")
+
+        traces = []
+        with patch_filters(self.news_check, wow_factor, values_fit):
+            passed, stage, updates = run_with_worker_session(
+                lambda session: filter_worker.process_article_with_tracing(
+                    unfiltered_articles[0], worker_run.id, RULES_PROMPT, traces
+                )
+            )
+
+        assert (passed, stage) == (False, "values_fit_error")
+        assert "API down" in updates['filter_notes']
+
+
+class TestDrainQueue:
+    """Tests for drain_queue"""
+
+    def test_articles_filtered_concurrently(self, unfiltered_articles, worker_run):
+        """Articles should wait on Claude concurrently and each result is reported once"""
+        def slow_news_check(article):
+            time.sleep(0.2)
+            return NewsCheckResult(passed=True, category="news_article", reasoning="news")
+
+        def wow_factor(article):
+            return WowFactorResult(passed=True, score=0.8, reasoning="wow")
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            return ValuesFitResult(passed=True, score=0.9, reasoning="fits")
+
+        finished = []
+        traces = []
+
+        async def on_result(article, passed, rejection_stage):
+            finished.append((article.id, passed, rejection_stage))
+
+        with patch.object(filter_worker, 'BATCH_SIZE', 2), \
+             patch_filters(slow_news_check, wow_factor, values_fit):
+            start = time.perf_counter_ns()
+            processed = run_with_worker_session(
+                lambda session: filter_worker.drain_queue(session, worker_run.id, RULES_PROMPT, traces, on_result)
+            )
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+
+        article_ids = {a.id for a in unfiltered_articles}
+        assert processed == len(unfiltered_articles)
+        assert {article_id for article_id, _, _ in finished} == article_ids
+        assert all(passed and stage is None for _, passed, stage in finished)
+        assert elapsed < 0.2 * len(unfiltered_articles)
+        assert len(traces) == 3 * len(unfiltered_articles)
+
+    def test_failure_releases_unfinished_articles(self, committed_session, unfiltered_articles, worker_run):
+        """An on_result error should cancel in-flight articles and return them to the queue"""
+        def slow_news_check(article):
+            time.sleep(0.2)
+            return NewsCheckResult(passed=False, category="press_release", reasoning="not news")
+
+        async def on_result(article, passed, rejection_stage):
+            raise RuntimeError("commit failed")
+
+        with patch.object(filter_worker, 'BATCH_SIZE', 2), \
+             patch_filters(slow_news_check, None, None), \
+             pytest.raises(RuntimeError, match="commit failed"):
+            run_with_worker_session(
+                lambda session: filter_worker.drain_queue(session, worker_run.id, RULES_PROMPT, [], on_result)
+            )
+
+        statuses = committed_session.scalars(
+            select(Article.filter_status).where(Article.id.in_([a.id for a in unfiltered_articles]))
+        ).all()
+        assert statuses == [FilterStatus.UNFILTERED] * len(unfiltered_articles)
+
+
+class TestFilterCache:
+    """Tests for cached filter results in the worker"""
+
+    def test_duplicate_content_skips_claude(self, committed_session, worker_run):
+        """A second article with identical content should be served from the cache"""
+        source = create_source()
+        committed_session.add(source)
+        committed_session.commit()
+
+        headline = "Goat Elected Honorary Mayor"
+        content = f"The town voted for a goat yesterday. {uuid4()} " * 5
+        committed_session.add_all([
+            create_article(
+                external_url=f"https://example.com/worker-test/{uuid4()}",
+                headline=headline,
+                source_id=source.id,
+                raw_content=content,
+                filter_status=FilterStatus.UNFILTERED,
+            )
+            for _ in range(2)
+        ])
+        committed_session.commit()
+
+        calls = []
+        traces = []
+
+        async def ignore_result(*args):
+            pass
+
+        def news_check(article):
+            calls.append("news_check")
+            return NewsCheckResult(passed=True, category="news_article", reasoning="news", input_tokens=100)
+
+        def wow_factor(article):
+            calls.append("wow_factor")
+            return WowFactorResult(passed=True, score=0.8, reasoning="wow", input_tokens=100)
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            calls.append("values_fit")
+            return ValuesFitResult(passed=True, score=0.9, reasoning="fits", input_tokens=100)
+
+        with patch.object(filter_worker, 'BATCH_SIZE', 1), \
+             patch_filters(news_check, wow_factor, values_fit):
+            processed = run_with_worker_session(
+                lambda session: filter_worker.drain_queue(session, worker_run.id, RULES_PROMPT, traces, ignore_result)
+            )
+
+        assert processed == 2
+        assert calls == ["news_check", "wow_factor", "values_fit"]
+
+        assert sorted(t.input_tokens for t in traces) == [0, 0, 0, 100, 100, 100]
+
+    def test_cache_store_failure_does_not_reject(self, unfiltered_articles, worker_run):
+        """A failing cache write should be logged, not turn a paid Claude answer into an error"""
+        def news_check(article):
+            return NewsCheckResult(passed=True, category="news_article", reasoning="news", input_tokens=100)
+
+        def wow_factor(article):
+            return WowFactorResult(passed=True, score=0.8, reasoning="wow", input_tokens=100)
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            return ValuesFitResult(passed=True, score=0.9, reasoning="fits", input_tokens=100)
+
+        def broken_store(*args):
+            raise RuntimeError("cache table locked")
+
+        with patch_filters(news_check, wow_factor, values_fit), \
+             patch.object(filter_worker, 'store_result', broken_store):
+            passed, stage, updates = run_with_worker_session(
+                lambda session: filter_worker.process_article_with_tracing(
+                    unfiltered_articles[0], worker_run.id, RULES_PROMPT, []
+                )
+            )
+
+        assert (passed, stage) == (True, None)
+        assert updates['filter_score'] == 0.9
+
+    def test_cached_score_rejudged_against_current_threshold(self, committed_session, worker_run):
+        """A cached wow score should be compared with today's threshold, not the one it was stored under"""
+        source = create_source()
+        committed_session.add(source)
+        committed_session.commit()
+
+        def add_article():
+            committed_session.add(create_article(
+                external_url=f"https://example.com/worker-test/{uuid4()}",
+                headline="Barn Raised in a Day",
+                source_id=source.id,
+                raw_content="Neighbors raised a barn in a single day. " * 5,
+                filter_status=FilterStatus.UNFILTERED,
+            ))
+            committed_session.commit()
+
+        finished = []
+
+        async def on_result(article, passed, rejection_stage):
+            finished.append(rejection_stage)
+
+        def news_check(article):
+            return NewsCheckResult(passed=True, category="news_article", reasoning="news", input_tokens=100)
+
+        def wow_factor(article):
+            return WowFactorResult(passed=True, score=0.6, reasoning="wow", input_tokens=100)
+
+        def values_fit(article, rules=None, rules_prompt=None):
+            return ValuesFitResult(passed=True, score=0.9, reasoning="fits", input_tokens=100)
+
+        def drain():
+            run_with_worker_session(
+                lambda session: filter_worker.drain_queue(session, worker_run.id, RULES_PROMPT, [], on_result)
+            )
+
+        with patch_filters(news_check, wow_factor, values_fit):
+            add_article()
+            drain()
+            stricter = [
+                replace(stage, threshold=0.7) if stage.name == "wow_factor" else stage
+                for stage in filter_worker.FILTER_PIPELINE
+            ]
+            with patch.object(filter_worker, 'FILTER_PIPELINE', stricter):
+                add_article()
+                drain()
+
+        assert finished == [None, "wow_factor"]
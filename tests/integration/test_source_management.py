@@ -11,14 +11,12 @@ Tests the /admin/sources routes for:
 import pytest
 from uuid import uuid4
 
-from app.database import SessionLocal
 from app.models import Source, SourceType, Article, ArticleStatus
 
 
-@pytest.fixture
-def test_source(test_session):
-    """Create a test RSS source."""
-    source = Source(
+def active_feed():
+    """Build the active RSS source used across these tests."""
+    return Source(
         name="Test Feed",
         type=SourceType.RSS,
         url="https://example.com/test-feed.xml",
@@ -26,36 +24,54 @@ def test_source(test_session):
         trust_score=0.5,
         notes="Test source for integration tests",
     )
-    test_session.add(source)
-    test_session.commit()
-    test_session.refresh(source)
-    return source
 
 
-@pytest.fixture
-def paused_source(test_session):
-    """Create a paused RSS source."""
-    source = Source(
+def paused_feed():
+    """Build the paused RSS source used across these tests."""
+    return Source(
         name="Paused Feed",
         type=SourceType.RSS,
         url="https://example.com/paused-feed.xml",
         is_active=False,
         trust_score=0.5,
     )
-    test_session.add(source)
-    test_session.commit()
-    test_session.refresh(source)
+
+
+@pytest.fixture
+def test_source(db_session):
+    """Create a test RSS source."""
+    source = active_feed()
+    db_session.add(source)
+    db_session.flush()
     return source
 
 
+@pytest.fixture
+def paused_source(db_session):
+    """Create a paused RSS source."""
+    source = paused_feed()
+    db_session.add(source)
+    db_session.flush()
+    return source
+
+
+@pytest.fixture
+def two_sources(db_session):
+    """Create an active and a paused RSS source in one INSERT."""
+    sources = (active_feed(), paused_feed())
+    db_session.add_all(sources)
+    db_session.flush()
+    return sources
+
+
 class TestListSources:
     """Tests for GET /admin/sources"""
     
-    def test_list_sources_empty(self, client, test_session):
+    def test_list_sources_empty(self, client, db_session):
         """Should show empty state when no RSS sources exist."""
         # Remove any existing RSS sources
-        test_session.query(Source).filter(Source.type == SourceType.RSS).delete()
-        test_session.commit()
+        db_session.query(Source).filter(Source.type == SourceType.RSS).delete()
+        db_session.flush()
         
         response = client.get('/admin/sources')
         assert response.status_code == 200
@@ -68,28 +84,28 @@ class TestListSources:
         assert b'Test Feed' in response.data
         assert b'example.com/test-feed.xml' in response.data
     
-    def test_list_sources_filter_active(self, client, test_source, paused_source):
+    def test_list_sources_filter_active(self, client, two_sources):
         """Should filter to show only active sources."""
         response = client.get('/admin/sources?status=active')
         assert response.status_code == 200
         assert b'Test Feed' in response.data
         assert b'Paused Feed' not in response.data
     
-    def test_list_sources_filter_paused(self, client, test_source, paused_source):
+    def test_list_sources_filter_paused(self, client, two_sources):
         """Should filter to show only paused sources."""
         response = client.get('/admin/sources?status=paused')
         assert response.status_code == 200
         assert b'Test Feed' not in response.data
         assert b'Paused Feed' in response.data
     
-    def test_list_sources_sort_by_name(self, client, test_source, paused_source):
+    def test_list_sources_sort_by_name(self, client, two_sources):
         """Should sort sources by name."""
         response = client.get('/admin/sources?sort=name')
         assert response.status_code == 200
         # Paused Feed comes before Test Feed alphabetically
-        data = response.data.decode()
-        paused_pos = data.find('Paused Feed')
-        test_pos = data.find('Test Feed')
+        data = response.data
+        paused_pos = data.find(b'Paused Feed')
+        test_pos = data.find(b'Test Feed')
         assert paused_pos < test_pos
 
 
@@ -134,7 +150,7 @@ class TestAddSource:
 class TestPauseSource:
     """Tests for POST /admin/sources/<id>/pause"""
     
-    def test_pause_active_source(self, client, test_source, test_session):
+    def test_pause_active_source(self, client, test_source, db_session):
         """Should pause an active source."""
         response = client.post(f'/admin/sources/{test_source.id}/pause')
         assert response.status_code == 200
@@ -143,7 +159,7 @@ class TestPauseSource:
         assert data['is_active'] is False
         
         # Verify in database
-        test_session.refresh(test_source)
+        db_session.expire(test_source, ['is_active'])
         assert test_source.is_active is False
     
     def test_pause_nonexistent_source(self, client):
@@ -156,7 +172,7 @@ class TestPauseSource:
 class TestResumeSource:
     """Tests for POST /admin/sources/<id>/resume"""
     
-    def test_resume_paused_source(self, client, paused_source, test_session):
+    def test_resume_paused_source(self, client, paused_source, db_session):
         """Should resume a paused source."""
         response = client.post(f'/admin/sources/{paused_source.id}/resume')
         assert response.status_code == 200
@@ -165,7 +181,7 @@ class TestResumeSource:
         assert data['is_active'] is True
         
         # Verify in database
-        test_session.refresh(paused_source)
+        db_session.expire(paused_source, ['is_active'])
         assert paused_source.is_active is True
     
     def test_resume_nonexistent_source(self, client):
@@ -178,7 +194,7 @@ class TestResumeSource:
 class TestDeleteSource:
     """Tests for POST /admin/sources/<id>/delete"""
     
-    def test_delete_source_no_articles(self, client, test_source, test_session):
+    def test_delete_source_no_articles(self, client, test_source, db_session):
         """Should delete source with no articles."""
         source_id = test_source.id
         response = client.post(f'/admin/sources/{source_id}/delete')
@@ -187,10 +203,10 @@ class TestDeleteSource:
         assert data['success'] is True
         
         # Verify deleted
-        deleted = test_session.query(Source).filter(Source.id == source_id).first()
+        deleted = db_session.query(Source).filter(Source.id == source_id).first()
         assert deleted is None
     
-    def test_delete_source_with_articles(self, client, test_source, test_session):
+    def test_delete_source_with_articles(self, client, test_source, db_session):
         """Should reject deletion if source has articles."""
         # Create an article linked to this source
         article = Article(
@@ -203,17 +219,13 @@ class TestDeleteSource:
             filter_score=0.5,
             status=ArticleStatus.PENDING,
         )
-        test_session.add(article)
-        test_session.commit()
+        db_session.add(article)
+        db_session.flush()
         
         response = client.post(f'/admin/sources/{test_source.id}/delete')
         assert response.status_code == 400
         data = response.get_json()
         assert 'existing articles' in data['error']
-        
-        # Clean up
-        test_session.delete(article)
-        test_session.commit()
     
     def test_delete_nonexistent_source(self, client):
         """Should return 404 for nonexistent source."""